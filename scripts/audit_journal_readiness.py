@@ -2,25 +2,112 @@
 from __future__ import annotations
 
 import argparse
-import json
+import csv
+import importlib.util
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Set
+from typing import TYPE_CHECKING, Dict, List, Set
 
 import numpy as np
-import pandas as pd
 
+from uavtre.io.json_codec import json_bytes
 from uavtre.io.schema import (
     RESULTS_MAIN_COLUMNS,
     RESULTS_ROUTES_COLUMNS,
     RESULTS_SIGNIFICANCE_COLUMNS,
 )
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 
 CRITICAL = "critical"
 HIGH = "high"
 MEDIUM = "medium"
 
+_TEXT_COLUMNS = {
+    "run_id",
+    "profile",
+    "git_sha",
+    "env_hash",
+    "timestamp",
+    "tw_mode",
+    "route_node_sequence",
+    "comparison_id",
+    "method_a",
+    "method_b",
+    "metric",
+    "test_name",
+    "correction_method",
+    "effect_direction",
+}
+# Low-cardinality labels the gates filter on; categorical codes make the
+# equality masks integer compares.
+_CATEGORY_COLUMNS = {"method", "claim_regime", "tw_family"}
+_INT_COLUMNS = {
+    "seed",
+    "N",
+    "M",
+    "Delta_min",
+    "B",
+    "K",
+    "feasible_flag",
+    "uav_id",
+    "n_pairs",
+    "significant_flag",
+}
+
+
+def _schema_dtypes(columns: List[str]) -> Dict[str, str]:
+    out: Dict[str, str] = {}
+    for col in columns:
+        if col in _CATEGORY_COLUMNS:
+            out[col] = "category"
+        elif col in _TEXT_COLUMNS:
+            out[col] = "string"
+        elif col in _INT_COLUMNS:
+            out[col] = "int64"
+        else:
+            out[col] = "float64"
+    return out
+
+
+MAIN_DTYPES = _schema_dtypes(RESULTS_MAIN_COLUMNS)
+ROUTES_DTYPES = _schema_dtypes(RESULTS_ROUTES_COLUMNS)
+SIGNIFICANCE_DTYPES = _schema_dtypes(RESULTS_SIGNIFICANCE_COLUMNS)
+_MAIN_HEADER = tuple(RESULTS_MAIN_COLUMNS)
+_ROUTES_HEADER = tuple(RESULTS_ROUTES_COLUMNS)
+_SIGNIFICANCE_HEADER = tuple(RESULTS_SIGNIFICANCE_COLUMNS)
+
+_CASE_KEY_COLUMNS = [
+    "seed",
+    "N",
+    "M",
+    "Delta_min",
+    "B",
+    "K",
+    "lambda_out",
+    "lambda_tw",
+    "tw_family",
+    "tw_mode",
+    "profile",
+]
+# Columns the gates read per table kind; schema gates use the header only.
+_NEEDED_COLUMNS = {
+    "main": set(_CASE_KEY_COLUMNS)
+    | {"method", "gap_pct", "best_bound", "claim_regime", "git_sha"},
+    "routes": set(RESULTS_ROUTES_COLUMNS),
+    "significance": {"p_value_adj", "effect_direction", "effect_size", "ci_low", "ci_high", "n_pairs"},
+}
+_DTYPES_BY_KIND = {
+    "main": MAIN_DTYPES,
+    "routes": ROUTES_DTYPES,
+    "significance": SIGNIFICANCE_DTYPES,
+}
+
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Audit journal-readiness gates.")
@@ -36,6 +123,11 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--main-b", default=None, help="Main-table TW-B results_main path.")
     parser.add_argument("--scal-b", default=None, help="Scalability TW-B results_main path.")
     parser.add_argument("--json-out", default=None, help="Optional explicit JSON report output path.")
+    parser.add_argument(
+        "--also-parquet",
+        action="store_true",
+        help="Also write the gate table next to the JSON report as Parquet (requires pyarrow).",
+    )
     parser.add_argument(
         "--fail-on-critical",
         action="store_true",
@@ -66,70 +158,145 @@ def _gate(
     )
 
 
-def _load_csv(path: Path) -> pd.DataFrame | None:
+def _load_csv(path: Path, kind: str | None = None) -> pd.DataFrame | None:
     if not path.exists():
         return None
-    return pd.read_csv(path)
+    # Keyed on mtime so a file rewritten between calls is parsed again.
+    return _read_csv_cached(str(path.resolve()), path.stat().st_mtime_ns, kind)
+
+
+def _read_header(path: Path) -> tuple[str, ...]:
+    return _read_header_cached(str(path.resolve()), path.stat().st_mtime_ns)
+
+
+@lru_cache(maxsize=32)
+def _read_header_cached(resolved: str, mtime_ns: int) -> tuple[str, ...]:
+    del mtime_ns  # cache key only
+    with open(resolved, newline="", encoding="utf-8-sig") as f:
+        return tuple(next(csv.reader(f), []))
+
+
+@lru_cache(maxsize=1)
+def _csv_engine() -> str:
+    # Arrow's multi-threaded tokenizer when available; plain C parser otherwise.
+    return "pyarrow" if importlib.util.find_spec("pyarrow") is not None else "c"
+
+
+@lru_cache(maxsize=32)
+def _read_csv_cached(resolved: str, mtime_ns: int, kind: str | None) -> pd.DataFrame:
+    import pandas as pd
+
+    if kind is None:
+        return pd.read_csv(resolved)
+    header = _read_header_cached(resolved, mtime_ns)
+    usecols = [c for c in header if c in _NEEDED_COLUMNS[kind]]
+    try:
+        return pd.read_csv(resolved, usecols=usecols, dtype=_DTYPES_BY_KIND[kind], engine=_csv_engine())
+    except (TypeError, ValueError):
+        # Malformed cells (blank ints, text in numeric columns) are reported by
+        # the gates below, so fall back to inference instead of aborting.
+        return pd.read_csv(resolved, usecols=usecols)
+
 
+def _load_csvs(specs: Dict[str, tuple[Path, str]]) -> Dict[str, pd.DataFrame | None]:
+    # The files are independent and the parsers release the GIL, so overlap
+    # them; a path used under several names is submitted only once.
+    futures: Dict[tuple[Path, str], Future] = {}
+    workers = max(1, min(len(specs), os.cpu_count() or 1))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for path, kind in specs.values():
+            key = (path.resolve(), kind)
+            if key not in futures:
+                futures[key] = pool.submit(_load_csv, path, kind)
+        return {name: futures[(path.resolve(), kind)].result() for name, (path, kind) in specs.items()}
 
-def _check_schema_main(df: pd.DataFrame) -> bool:
-    return list(df.columns) == RESULTS_MAIN_COLUMNS
 
+def _check_schema_main(header: tuple[str, ...]) -> bool:
+    return header == _MAIN_HEADER
 
-def _check_gap_sanity(df: pd.DataFrame) -> tuple[int, int]:
-    gap = pd.to_numeric(df["gap_pct"], errors="coerce")
-    neg = int((gap.dropna() < -1e-9).sum())
-    inf = int(np.isinf(gap.fillna(np.nan)).sum())
+
+def _numeric_columns(df: pd.DataFrame | None) -> Dict[str, pd.Series]:
+    """Coerce the numeric columns the gates share, once per results frame."""
+    import pandas as pd
+
+    if df is None:
+        return {}
+    return {
+        col: pd.to_numeric(df[col], errors="coerce")
+        for col in ("N", "gap_pct")
+        if col in df.columns
+    }
+
+
+def _check_gap_sanity(num: Dict[str, pd.Series]) -> tuple[int, int]:
+    gap = num["gap_pct"].to_numpy(dtype=np.float64, copy=False)
+    neg = int(np.count_nonzero(gap < -1e-9))
+    inf = int(np.count_nonzero(np.isinf(gap)))
     return neg, inf
 
 
-def _check_exact_certification(df: pd.DataFrame) -> tuple[int, int]:
-    sub = df[(df["N"] <= 10) & (df["method"] == "highs_exact_bound")]
-    if sub.empty:
+def _eq_mask(ser: pd.Series, value: str) -> np.ndarray:
+    return (ser == value).to_numpy(dtype=bool, na_value=False)
+
+
+def _check_exact_certification(df: pd.DataFrame, num: Dict[str, pd.Series]) -> tuple[int, int]:
+    n_arr = num["N"].to_numpy(dtype=np.float64)
+    sub_mask = (n_arr <= 10) & _eq_mask(df["method"], "highs_exact_bound")
+    if not sub_mask.any():
         return 0, 0
-    exact_rows = sub[sub["claim_regime"] == "exact"]
-    uncert = int(
-        exact_rows["gap_pct"].isna().sum()
-        + (
-            pd.to_numeric(exact_rows["gap_pct"], errors="coerce")
-            .fillna(0.0)
-            .abs()
-            > 1e-9
-        ).sum()
+    exact_mask = sub_mask & _eq_mask(df["claim_regime"], "exact")
+    gap = num["gap_pct"].to_numpy(dtype=np.float64)
+    # NaN compares False here, matching the old fillna(0.0) before the tolerance test.
+    uncert = np.count_nonzero(exact_mask & df["gap_pct"].isna().to_numpy()) + np.count_nonzero(
+        exact_mask & (np.abs(gap) > 1e-9)
     )
-    return int(len(exact_rows)), uncert
+    return int(np.count_nonzero(exact_mask)), int(uncert)
 
 
-def _check_scalability_policy(df: pd.DataFrame) -> tuple[int, int]:
-    sub = df[df["N"] >= 80]
-    if sub.empty:
+def _check_scalability_policy(df: pd.DataFrame, num: Dict[str, pd.Series]) -> tuple[int, int]:
+    mask80 = num["N"].to_numpy(dtype=np.float64) >= 80
+    rows = int(np.count_nonzero(mask80))
+    if rows == 0:
         return 0, 0
-    invalid = int(
-        sub["gap_pct"].notna().sum()
-        + sub["best_bound"].notna().sum()
-        + (sub["claim_regime"] != "scalability_only").sum()
+    violate = (
+        df["gap_pct"].notna().to_numpy()
+        | df["best_bound"].notna().to_numpy()
+        | ~_eq_mask(df["claim_regime"], "scalability_only")
     )
-    return int(len(sub)), invalid
+    return rows, int(np.count_nonzero(mask80 & violate))
 
 
 def _check_git_trace(df: pd.DataFrame) -> int:
     ser = df["git_sha"].astype(str)
-    return int(ser.str.contains(r"unknown|nogit-", regex=True, na=False).sum())
+    # Plain substring tests; no regex engine needed for two literal tokens.
+    mask = ser.str.contains("unknown", regex=False, na=False) | ser.str.contains(
+        "nogit-", regex=False, na=False
+    )
+    return int(np.count_nonzero(mask.to_numpy(dtype=bool)))
 
 
 def _collect_families(*dfs: pd.DataFrame | None) -> List[str]:
+    import pandas as pd
+
     fam = set()
     for df in dfs:
         if df is None or "tw_family" not in df.columns:
             continue
-        fam.update(df["tw_family"].dropna().astype(str).unique().tolist())
+        col = df["tw_family"]
+        if isinstance(col.dtype, pd.CategoricalDtype):
+            # Categories read from the CSV are exactly the observed labels.
+            fam.update(col.cat.categories.astype(str).tolist())
+        else:
+            fam.update(col.dropna().astype(str).unique().tolist())
     return sorted(fam)
 
 
-def _n_set(df: pd.DataFrame | None) -> Set[int]:
-    if df is None or "N" not in df.columns:
+def _n_set(num: Dict[str, pd.Series]) -> Set[int]:
+    if "N" not in num:
         return set()
-    return set(pd.to_numeric(df["N"], errors="coerce").dropna().astype(int).tolist())
+    # Reduce to the distinct sizes in numpy; only those few reach Python.
+    arr = num["N"].to_numpy(dtype=np.float64, na_value=np.nan)
+    return set(np.unique(arr[~np.isnan(arr)].astype(np.int64)).tolist())
 
 
 def _resolve_paths(args: argparse.Namespace) -> tuple[Path, Path, Path, Path, Path | None]:
@@ -152,32 +319,32 @@ def _resolve_paths(args: argparse.Namespace) -> tuple[Path, Path, Path, Path, Pa
     return main_a, scal_a, main_b, scal_b, None
 
 
-def _paired_case_count(df: pd.DataFrame, method_a: str, method_b: str, n: int) -> int:
-    key_cols = [
-        "seed",
-        "N",
-        "M",
-        "Delta_min",
-        "B",
-        "K",
-        "lambda_out",
-        "lambda_tw",
-        "tw_family",
-        "tw_mode",
-        "profile",
-    ]
+def _paired_case_count(
+    df: pd.DataFrame,
+    num: Dict[str, pd.Series],
+    method_a: str,
+    method_b: str,
+    n: int,
+) -> int:
+    import pandas as pd
+
+    key_cols = _CASE_KEY_COLUMNS
     required = set(key_cols + ["method"])
     if not required.issubset(df.columns):
         return 0
 
-    dfa = df[(df["method"] == method_a) & (pd.to_numeric(df["N"], errors="coerce") == n)]
-    dfb = df[(df["method"] == method_b) & (pd.to_numeric(df["N"], errors="coerce") == n)]
-    if dfa.empty or dfb.empty:
+    n_mask = num["N"].to_numpy(dtype=np.float64) == n
+    mask_a = n_mask & _eq_mask(df["method"], method_a)
+    mask_b = n_mask & _eq_mask(df["method"], method_b)
+    if not mask_a.any() or not mask_b.any():
         return 0
 
-    pa = dfa[key_cols].drop_duplicates()
-    pb = dfb[key_cols].drop_duplicates()
-    return int(len(pa.merge(pb, on=key_cols, how="inner")))
+    # Distinct case keys shared by both methods; a 64-bit row hash stands in
+    # for the key tuple, collisions being negligible for a coverage count.
+    hashes = pd.util.hash_pandas_object(df[key_cols], index=False).to_numpy()
+    ha = np.unique(hashes[mask_a])
+    hb = np.unique(hashes[mask_b])
+    return int(np.intersect1d(ha, hb, assume_unique=True).size)
 
 
 def _check_significance_integrity(sig_df: pd.DataFrame) -> tuple[int, int]:
@@ -186,18 +353,16 @@ def _check_significance_integrity(sig_df: pd.DataFrame) -> tuple[int, int]:
     if missing_cols:
         return 0, int(1e9)
 
-    invalid = sig_df.copy()
-    invalid["n_pairs_num"] = pd.to_numeric(invalid["n_pairs"], errors="coerce")
-    invalid_mask = (
-        invalid["p_value_adj"].isna()
-        | invalid["effect_direction"].isna()
-        | invalid["effect_size"].isna()
-        | invalid["ci_low"].isna()
-        | invalid["ci_high"].isna()
-        | invalid["n_pairs_num"].isna()
-        | (invalid["n_pairs_num"] <= 0)
+    import pandas as pd
+
+    n_pairs = pd.to_numeric(sig_df["n_pairs"], errors="coerce").to_numpy(
+        dtype=np.float64, na_value=np.nan
     )
-    return int(len(sig_df)), int(invalid_mask.sum())
+    # NaN <= 0 is False, so the isnan term is what flags missing n_pairs.
+    invalid_mask = np.isnan(n_pairs) | (n_pairs <= 0)
+    for col in ("p_value_adj", "effect_direction", "effect_size", "ci_low", "ci_high"):
+        invalid_mask |= sig_df[col].isna().to_numpy()
+    return int(len(sig_df)), int(np.count_nonzero(invalid_mask))
 
 
 def main() -> None:
@@ -206,15 +371,34 @@ def main() -> None:
 
     main_a_path, scal_a_path, main_b_path, scal_b_path, campaign_dir = _resolve_paths(args)
 
-    main_a = _load_csv(main_a_path)
-    scal_a = _load_csv(scal_a_path)
-    main_b = _load_csv(main_b_path)
-    scal_b = _load_csv(scal_b_path)
-
     sig_a_path = main_a_path.parent / "results_significance.csv"
     sig_b_path = main_b_path.parent / "results_significance.csv"
-    sig_a = _load_csv(sig_a_path)
-    sig_b = _load_csv(sig_b_path)
+    specs = {
+        "main_a": (main_a_path, "main"),
+        "scal_a": (scal_a_path, "main"),
+        "main_b": (main_b_path, "main"),
+        "scal_b": (scal_b_path, "main"),
+        "sig_a": (sig_a_path, "significance"),
+        "sig_b": (sig_b_path, "significance"),
+        "root_main": (output_root / "results_main.csv", "main"),
+        "root_routes": (output_root / "results_routes.csv", "routes"),
+        "root_sig": (output_root / "results_significance.csv", "significance"),
+    }
+    loaded = _load_csvs(specs)
+    headers = {
+        name: _read_header(path) for name, (path, _) in specs.items() if loaded[name] is not None
+    }
+    main_a = loaded["main_a"]
+    scal_a = loaded["scal_a"]
+    main_b = loaded["main_b"]
+    scal_b = loaded["scal_b"]
+    sig_a = loaded["sig_a"]
+    sig_b = loaded["sig_b"]
+
+    main_a_num = _numeric_columns(main_a)
+    scal_a_num = _numeric_columns(scal_a)
+    main_b_num = _numeric_columns(main_b)
+    scal_b_num = _numeric_columns(scal_b)
 
     gates: List[Dict[str, object]] = []
 
@@ -238,10 +422,10 @@ def main() -> None:
             gates,
             "schema.main_a",
             CRITICAL,
-            _check_schema_main(main_a),
+            _check_schema_main(headers["main_a"]),
             "results_main schema check for TW-A main-table",
         )
-        neg, inf = _check_gap_sanity(main_a)
+        neg, inf = _check_gap_sanity(main_a_num)
         _gate(
             gates,
             "gap_sanity.main_a",
@@ -249,7 +433,7 @@ def main() -> None:
             neg == 0 and inf == 0,
             f"TW-A main gap sanity: neg={neg}, inf={inf}",
         )
-        exact_rows, uncert = _check_exact_certification(main_a)
+        exact_rows, uncert = _check_exact_certification(main_a, main_a_num)
         _gate(
             gates,
             "exact_cert.main_a",
@@ -265,7 +449,7 @@ def main() -> None:
             unknown == 0,
             f"TW-A main fallback git_sha rows={unknown}",
         )
-        nset = _n_set(main_a)
+        nset = _n_set(main_a_num)
         _gate(
             gates,
             "coverage.main_a_sizes",
@@ -279,10 +463,10 @@ def main() -> None:
             gates,
             "schema.scal_a",
             CRITICAL,
-            _check_schema_main(scal_a),
+            _check_schema_main(headers["scal_a"]),
             "results_main schema check for TW-A scalability",
         )
-        rows, invalid = _check_scalability_policy(scal_a)
+        rows, invalid = _check_scalability_policy(scal_a, scal_a_num)
         _gate(
             gates,
             "policy.scal_a",
@@ -290,7 +474,7 @@ def main() -> None:
             invalid == 0,
             f"TW-A scalability rows={rows}, invalid_policy_rows={invalid}",
         )
-        nset = _n_set(scal_a)
+        nset = _n_set(scal_a_num)
         _gate(
             gates,
             "coverage.scal_a_size",
@@ -304,10 +488,10 @@ def main() -> None:
             gates,
             "schema.main_b",
             CRITICAL,
-            _check_schema_main(main_b),
+            _check_schema_main(headers["main_b"]),
             "results_main schema check for TW-B main-table",
         )
-        nset = _n_set(main_b)
+        nset = _n_set(main_b_num)
         _gate(
             gates,
             "coverage.main_b_sizes",
@@ -323,10 +507,10 @@ def main() -> None:
             gates,
             "schema.scal_b",
             CRITICAL,
-            _check_schema_main(scal_b),
+            _check_schema_main(headers["scal_b"]),
             "results_main schema check for TW-B scalability",
         )
-        nset = _n_set(scal_b)
+        nset = _n_set(scal_b_num)
         _gate(
             gates,
             "coverage.scal_b_size",
@@ -351,7 +535,7 @@ def main() -> None:
             gates,
             "schema.sig_a",
             HIGH,
-            list(sig_a.columns) == RESULTS_SIGNIFICANCE_COLUMNS,
+            headers["sig_a"] == _SIGNIFICANCE_HEADER,
             f"TW-A significance schema at {sig_a_path}",
         )
         rows, invalid = _check_significance_integrity(sig_a)
@@ -370,7 +554,7 @@ def main() -> None:
             gates,
             "schema.sig_b",
             HIGH,
-            list(sig_b.columns) == RESULTS_SIGNIFICANCE_COLUMNS,
+            headers["sig_b"] == _SIGNIFICANCE_HEADER,
             f"TW-B significance schema at {sig_b_path}",
         )
         rows, invalid = _check_significance_integrity(sig_b)
@@ -385,8 +569,8 @@ def main() -> None:
         _gate(gates, "files.sig_b_exists", HIGH, False, f"{sig_b_path} missing")
 
     if main_a is not None:
-        c20 = _paired_case_count(main_a, "ortools_main", "pyvrp_baseline", 20)
-        c40 = _paired_case_count(main_a, "ortools_main", "pyvrp_baseline", 40)
+        c20 = _paired_case_count(main_a, main_a_num, "ortools_main", "pyvrp_baseline", 20)
+        c40 = _paired_case_count(main_a, main_a_num, "ortools_main", "pyvrp_baseline", 40)
         _gate(
             gates,
             "stats.main_a_pair_coverage_n20_n40",
@@ -396,8 +580,8 @@ def main() -> None:
         )
 
     if main_b is not None:
-        c20 = _paired_case_count(main_b, "ortools_main", "pyvrp_baseline", 20)
-        c40 = _paired_case_count(main_b, "ortools_main", "pyvrp_baseline", 40)
+        c20 = _paired_case_count(main_b, main_b_num, "ortools_main", "pyvrp_baseline", 20)
+        c40 = _paired_case_count(main_b, main_b_num, "ortools_main", "pyvrp_baseline", 40)
         _gate(
             gates,
             "stats.main_b_pair_coverage_n20_n40",
@@ -422,9 +606,9 @@ def main() -> None:
             "campaign metadata files present" if not missing else f"missing={missing}",
         )
 
-    root_main = _load_csv(output_root / "results_main.csv")
-    root_routes = _load_csv(output_root / "results_routes.csv")
-    root_sig = _load_csv(output_root / "results_significance.csv")
+    root_main = loaded["root_main"]
+    root_routes = loaded["root_routes"]
+    root_sig = loaded["root_sig"]
     _gate(
         gates,
         "files.root_triplet",
@@ -437,7 +621,7 @@ def main() -> None:
             gates,
             "schema.root_routes",
             MEDIUM,
-            list(root_routes.columns) == RESULTS_ROUTES_COLUMNS,
+            headers["root_routes"] == _ROUTES_HEADER,
             "results_routes schema",
         )
     if root_sig is not None:
@@ -445,7 +629,7 @@ def main() -> None:
             gates,
             "schema.root_significance",
             MEDIUM,
-            list(root_sig.columns) == RESULTS_SIGNIFICANCE_COLUMNS,
+            headers["root_sig"] == _SIGNIFICANCE_HEADER,
             "results_significance schema",
         )
 
@@ -471,10 +655,19 @@ def main() -> None:
         ts = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
         out_path = output_root / "audit" / f"journal_readiness_{ts}.json"
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    out_path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    out_path.write_bytes(json_bytes(report))
+    if args.also_parquet:
+        import pandas as pd
+
+        parquet_path = out_path.with_suffix(".parquet")
+        pd.DataFrame(gates, columns=["gate_id", "severity", "passed", "message"]).assign(
+            generated_at_utc=report["generated_at_utc"]
+        ).to_parquet(parquet_path, index=False, compression="zstd")
 
-    print(json.dumps(report["summary"], indent=2))
+    print(json_bytes(report["summary"]).decode("utf-8"))
     print(f"report: {out_path}")
+    if args.also_parquet:
+        print(f"parquet: {parquet_path}")
 
     if args.fail_on_critical and critical_fail:
         raise SystemExit(1)
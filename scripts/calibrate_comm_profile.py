@@ -13,8 +13,9 @@ from uavtre.risk.edge_risk import compute_risk_matrix
 from uavtre.scenario.generator import generate_scenario
 
 
-def mean_edge_risk(cfg, bs_count: int, n_clients: int, delta_min: int, seeds: list[int]) -> float:
-    means: list[float] = []
+def build_scenarios(cfg, bs_count: int, n_clients: int, delta_min: int, seeds: list[int]) -> list:
+    # Scenarios do not depend on comm parameters, so build them once per sweep.
+    scenarios = []
     for seed in seeds:
         spec = ScenarioSpec(
             run_id=f"cal_{seed}",
@@ -29,32 +30,73 @@ def mean_edge_risk(cfg, bs_count: int, n_clients: int, delta_min: int, seeds: li
             tw_family=cfg.tw.family,
             tw_mode=cfg.tw.mode,
         )
-        scenario = generate_scenario(cfg, spec)
+        scenarios.append(generate_scenario(cfg, spec))
+    return scenarios
+
+
+def mean_edge_risk(cfg, scenarios: list) -> float:
+    means: list[float] = []
+    for scenario in scenarios:
         risk = compute_risk_matrix(scenario, cfg.comm, cfg.edge_samples)
-        vals = risk[np.triu_indices_from(risk, 1)]
-        means.append(float(vals.mean()))
+        # risk is symmetric with a zero diagonal, so the off-diagonal mean equals
+        # the strict upper-triangle mean without gathering it into a copy.
+        n = risk.shape[0]
+        means.append(float((risk.sum() - np.trace(risk)) / (n * (n - 1))))
     return float(np.mean(means))
 
 
+def _band_score(mr: float, target_low: float, target_high: float) -> float:
+    if mr < target_low:
+        return target_low - mr
+    if mr > target_high:
+        return mr - target_high
+    return 0.0
+
+
 def calibrate(cfg, target_low: float, target_high: float, bs_count: int, n_clients: int, delta_min: int, seeds: list[int]):
     # Keep channel model structure fixed and tune operational threshold.
-    candidates = []
+    scenarios = build_scenarios(cfg, bs_count, n_clients, delta_min, seeds)
     base_thr = float(cfg.comm["snr_threshold_db"])
-    for snr_thr in np.linspace(base_thr, base_thr + 40.0, 17):
-        cfg.comm["snr_threshold_db"] = float(snr_thr)
-        mr = mean_edge_risk(cfg, bs_count, n_clients, delta_min, seeds)
-        score = 0.0
-        if mr < target_low:
-            score = target_low - mr
-        elif mr > target_high:
-            score = mr - target_high
-        candidates.append((score, mr, float(snr_thr)))
-
-    candidates.sort(key=lambda x: x[0])
-    best = candidates[0]
+    grid = [float(t) for t in np.linspace(base_thr, base_thr + 40.0, 17)]
+    risk_by_idx: dict[int, float] = {}
+
+    def risk_at(idx: int) -> float:
+        if idx not in risk_by_idx:
+            cfg.comm["snr_threshold_db"] = grid[idx]
+            risk_by_idx[idx] = mean_edge_risk(cfg, scenarios)
+        return risk_by_idx[idx]
+
+    def score_at(idx: int) -> float:
+        return _band_score(risk_at(idx), target_low, target_high)
+
+    # Outage risk is non-decreasing in the threshold, so bisect for the first grid
+    # point reaching target_low. From there on the band score never falls, so lo is the
+    # best point at or above target_low; below it the score never rises, so lo-1 is the
+    # best point under target_low.
+    lo, hi = 0, len(grid)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if risk_at(mid) < target_low:
+            lo = mid + 1
+        else:
+            hi = mid
+    candidates = [idx for idx in (lo - 1, lo) if 0 <= idx < len(grid)]
+    best = min(candidates, key=lambda idx: (score_at(idx), idx))
+    if best == lo - 1:
+        # A flat stretch below target_low ties with lo-1; the full sweep kept the lowest
+        # threshold among equal scores, so bisect back for the first point of the tie.
+        best_score = score_at(best)
+        first, last = 0, best
+        while first < last:
+            mid = (first + last) // 2
+            if score_at(mid) <= best_score:
+                last = mid
+            else:
+                first = mid + 1
+        best = first
     return {
-        "snr_threshold_db": best[2],
-        "mean_edge_risk": best[1],
+        "snr_threshold_db": grid[best],
+        "mean_edge_risk": risk_at(best),
         "target_low": target_low,
         "target_high": target_high,
     }
@@ -3,8 +3,22 @@ from __future__ import annotations
 
 import argparse
 import json
+import mmap
+import os
+import re
+import stat
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
+from uavtre.io.json_codec import json_loads
+
+
+FORBIDDEN_PATTERNS = ("/home/", "/mnt/", "journal_core")
+_FORBIDDEN_RE = re.compile(b"|".join(re.escape(p.encode()) for p in FORBIDDEN_PATTERNS))
+_MMAP_MIN_BYTES = 64 * 1024
+_TEXT_SCAN_SUFFIXES = frozenset({".md", ".txt"})
+
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Validate campaign-scoped manuscript package integrity.")
@@ -16,43 +30,128 @@ def parse_args() -> argparse.Namespace:
 
 
 def _load_json(path: Path) -> dict:
-    return json.loads(path.read_text(encoding="utf-8"))
+    return _load_json_cached(path.resolve().as_posix())
+
+
+@lru_cache(maxsize=None)
+def _load_json_cached(path_str: str) -> dict:
+    # Manifests are read-only for the whole check; parse each one once.
+    return json_loads(Path(path_str).read_bytes())
+
 
+def _list_dir(directory: Path) -> frozenset[str]:
+    # exists() follows symlinks, so a dangling link still counts as missing.
+    try:
+        with os.scandir(directory) as it:
+            return frozenset(e.name for e in it if not e.is_symlink() or os.path.exists(e.path))
+    except OSError:
+        return frozenset()
 
-def _check_exists(path: Path, errors: list[str]) -> None:
-    if not path.exists():
+
+def _exists(path: Path, listings: dict[Path, frozenset[str]]) -> bool:
+    # One listing per directory per run answers every existence check under that directory.
+    if path.name in ("", ".."):
+        # The root, "." and ".." never appear in a parent listing.
+        return path.exists()
+    parent = path.parent
+    if parent not in listings:
+        listings[parent] = _list_dir(parent)
+    return path.name in listings[parent]
+
+
+def _check_exists(path: Path, errors: list[str], listings: dict[Path, frozenset[str]]) -> None:
+    if not _exists(path, listings):
         errors.append(f"missing file: {path.as_posix()}")
 
 
-def _check_no_pattern(path: Path, pattern: str, errors: list[str], allow_if_contains: str | None = None) -> None:
-    if not path.exists():
+def _scan_forbidden(path: Path) -> set[bytes]:
+    # Open directly: the fstat on the open handle answers both "is it a file" and "how big".
+    try:
+        f = path.open("rb")
+    except (FileNotFoundError, IsADirectoryError):
+        return set()
+    with f:
+        st = os.fstat(f.fileno())
+        if not stat.S_ISREG(st.st_mode):
+            return set()
+        # Patterns are ASCII, so scanning raw bytes matches the decoded text without decoding it.
+        if st.st_size < _MMAP_MIN_BYTES:
+            return set(_FORBIDDEN_RE.findall(f.read()))
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return set(_FORBIDDEN_RE.findall(mm))
+
+
+def _json_strings(node) -> list[str]:
+    if isinstance(node, str):
+        return [node]
+    if isinstance(node, dict):
+        out = []
+        for key, value in node.items():
+            out.append(str(key))
+            out.extend(_json_strings(value))
+        return out
+    if isinstance(node, list):
+        return [text for item in node for text in _json_strings(item)]
+    return []
+
+
+def _scan_forbidden_json(path: Path) -> set[bytes]:
+    # Manifests are usually parsed already; scan their strings instead of re-reading the file.
+    try:
+        data = _load_json(path)
+    except (OSError, ValueError):
+        return _scan_forbidden(path)
+    text = "\n".join(_json_strings(data))
+    return set(_FORBIDDEN_RE.findall(text.encode("utf-8", errors="ignore")))
+
+
+def _check_forbidden(
+    path: Path,
+    errors: list[str],
+    allow_if_contains: str | None = None,
+) -> None:
+    path_str = path.as_posix()
+    if allow_if_contains and allow_if_contains in path_str:
         return
-    text = path.read_text(encoding="utf-8", errors="ignore")
-    if pattern in text:
-        if allow_if_contains and allow_if_contains in path.as_posix():
-            return
-        errors.append(f"forbidden pattern '{pattern}' in {path.as_posix()}")
+    # One regex pass finds every forbidden pattern; report them in declaration order.
+    if path.suffix == ".json":
+        found = _scan_forbidden_json(path)
+    elif path.suffix in _TEXT_SCAN_SUFFIXES:
+        found = _scan_forbidden(path)
+    else:
+        return
+    for pattern in FORBIDDEN_PATTERNS:
+        if pattern.encode() in found:
+            errors.append(f"forbidden pattern '{pattern}' in {path_str}")
 
 
-def _validate_bundle(bundle_dir: Path, campaign_id: str, errors: list[str]) -> None:
+def _validate_bundle(
+    bundle_dir: Path,
+    campaign_id: str,
+    listings: dict[Path, frozenset[str]],
+) -> list[str]:
+    errors: list[str] = []
     manifest_path = bundle_dir / "BUNDLE_MANIFEST.json"
-    _check_exists(manifest_path, errors)
-    if not manifest_path.exists():
-        return
+    manifest_str = manifest_path.as_posix()
+    try:
+        manifest = _load_json(manifest_path)
+    except FileNotFoundError:
+        errors.append(f"missing file: {manifest_str}")
+        return errors
 
-    manifest = _load_json(manifest_path)
-    if str(manifest.get("campaign_id")) != campaign_id:
-        errors.append(
-            f"bundle campaign mismatch in {manifest_path.as_posix()}: "
-            f"{manifest.get('campaign_id')} != {campaign_id}"
-        )
+    bundle_campaign = manifest.get("campaign_id")
+    if str(bundle_campaign) != campaign_id:
+        errors.append(f"bundle campaign mismatch in {manifest_str}: {bundle_campaign} != {campaign_id}")
 
     if int(manifest.get("submission_artifact_count", 0)) < 8:
-        errors.append(f"bundle missing submission artifacts in {manifest_path.as_posix()}")
+        errors.append(f"bundle missing submission artifacts in {manifest_str}")
 
-    for rel in manifest.get("submission_artifacts", []):
-        path = bundle_dir / rel
-        _check_exists(path, errors)
+    artifacts = manifest.get("submission_artifacts") or ()
+    # Artifacts share a few parent directories, so these lookups reuse this run's listings
+    # rather than walking the whole bundle (which also holds src/, tests/ and campaign copies).
+    for rel in artifacts:
+        _check_exists(bundle_dir / rel, errors, listings)
+    return errors
 
 
 def main() -> None:
@@ -63,70 +162,82 @@ def main() -> None:
     anonymous_dir = Path(args.anonymous_dir)
     camera_ready_dir = Path(args.camera_ready_dir)
 
-    required = [
+    # Every Path is built once; the active artifacts reuse the required-file entries.
+    manifest_path = submission_dir / f"MANUSCRIPT_PACK_MANIFEST_{campaign_id}.json"
+    active_submission = [
         submission_dir / f"claim_evidence_map_{campaign_id}.md",
         submission_dir / f"results_discussion_draft_{campaign_id}.md",
         submission_dir / f"next_steps_{campaign_id}.md",
         submission_dir / f"TABLE_FIGURE_INDEX_{campaign_id}.md",
-        submission_dir / f"MANUSCRIPT_PACK_MANIFEST_{campaign_id}.json",
+        manifest_path,
         submission_dir / f"RELEASE_NOTE_{campaign_id}.md",
         submission_dir / "build_instructions.md",
+    ]
+    required = active_submission + [
         submission_dir / "tr_e_presubmission_checklist.md",
         submission_dir / "proposal_highlights.txt",
         submission_dir / "cover_letter_draft.txt",
     ]
 
     errors: list[str] = []
+    listings: dict[Path, frozenset[str]] = {}
 
     for path in required:
-        _check_exists(path, errors)
+        _check_exists(path, errors, listings)
 
     # No stale names in active submission root.
-    for path in submission_dir.glob("*"):
-        if path.is_file() and "journal_core" in path.name:
-            errors.append(f"stale filename in submission root: {path.as_posix()}")
-
-    manifest_path = submission_dir / f"MANUSCRIPT_PACK_MANIFEST_{campaign_id}.json"
-    if manifest_path.exists():
+    # DirEntry.is_file() reuses the type from the listing, so no stat per entry.
+    try:
+        with os.scandir(submission_dir) as it:
+            for entry in it:
+                if "journal_core" in entry.name and entry.is_file():
+                    stale = submission_dir / entry.name
+                    errors.append(f"stale filename in submission root: {stale.as_posix()}")
+    except FileNotFoundError:
+        pass
+
+    # The required-file loop already reported a missing manifest; parse it exactly once here.
+    try:
         manifest = _load_json(manifest_path)
-        if str(manifest.get("campaign_id")) != campaign_id:
+    except FileNotFoundError:
+        manifest = None
+    except json.JSONDecodeError:
+        manifest = None
+        errors.append(f"manifest is not valid JSON: {manifest_path.as_posix()}")
+    if manifest is not None:
+        get = manifest.get
+        if str(get("campaign_id")) != campaign_id:
             errors.append("manifest campaign_id mismatch")
-        audit = manifest.get("audit_summary", {})
-        if not bool(audit.get("overall_pass", False)):
+        if not bool(get("audit_summary", {}).get("overall_pass", False)):
             errors.append("audit_summary.overall_pass is false")
-        if str(manifest.get("campaign_root", "")).startswith("/"):
-            errors.append("manifest campaign_root must be relative")
-        if str(manifest.get("campaign_dir", "")).startswith("/"):
-            errors.append("manifest campaign_dir must be relative")
-        if str(manifest.get("audit_json", "")).startswith("/"):
-            errors.append("manifest audit_json must be relative")
+        for key in ("campaign_root", "campaign_dir", "audit_json"):
+            if str(get(key, "")).startswith("/"):
+                errors.append(f"manifest {key} must be relative")
 
     # No absolute host paths or stale keywords in active artifacts.
+    bundle_copies = [
+        f"claim_evidence_map_{campaign_id}.md",
+        f"RELEASE_NOTE_{campaign_id}.md",
+        "build_instructions.md",
+    ]
+    anonymous_submission = anonymous_dir / "output" / "submission"
+    camera_ready_submission = camera_ready_dir / "output" / "submission"
     active_files = [
-        submission_dir / f"claim_evidence_map_{campaign_id}.md",
-        submission_dir / f"results_discussion_draft_{campaign_id}.md",
-        submission_dir / f"next_steps_{campaign_id}.md",
-        submission_dir / f"TABLE_FIGURE_INDEX_{campaign_id}.md",
-        submission_dir / f"MANUSCRIPT_PACK_MANIFEST_{campaign_id}.json",
-        submission_dir / f"RELEASE_NOTE_{campaign_id}.md",
-        submission_dir / "build_instructions.md",
+        *active_submission,
         anonymous_dir / "BUNDLE_MANIFEST.json",
         camera_ready_dir / "BUNDLE_MANIFEST.json",
-        anonymous_dir / "output" / "submission" / f"claim_evidence_map_{campaign_id}.md",
-        anonymous_dir / "output" / "submission" / f"RELEASE_NOTE_{campaign_id}.md",
-        anonymous_dir / "output" / "submission" / "build_instructions.md",
-        camera_ready_dir / "output" / "submission" / f"claim_evidence_map_{campaign_id}.md",
-        camera_ready_dir / "output" / "submission" / f"RELEASE_NOTE_{campaign_id}.md",
-        camera_ready_dir / "output" / "submission" / "build_instructions.md",
+        *(anonymous_submission / name for name in bundle_copies),
+        *(camera_ready_submission / name for name in bundle_copies),
     ]
 
     for path in active_files:
-        _check_no_pattern(path, "/home/", errors)
-        _check_no_pattern(path, "/mnt/", errors)
-        _check_no_pattern(path, "journal_core", errors)
+        _check_forbidden(path, errors)
 
-    _validate_bundle(anonymous_dir, campaign_id, errors)
-    _validate_bundle(camera_ready_dir, campaign_id, errors)
+    # The bundles are disjoint trees; validate them side by side and keep the report order.
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        bundle_dirs = [anonymous_dir, camera_ready_dir]
+        for bundle_errors in pool.map(_validate_bundle, bundle_dirs, [campaign_id] * 2, [listings] * 2):
+            errors.extend(bundle_errors)
 
     result = {
         "campaign_id": campaign_id,
@@ -3,9 +3,17 @@ from __future__ import annotations
 
 import argparse
 import hashlib
-import json
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 
+from uavtre.io.json_codec import json_loads
+
+try:
+    import xxhash
+except ImportError:  # pragma: no cover
+    xxhash = None
+
 
 ROOT = Path(__file__).resolve().parents[1]
 
@@ -15,13 +23,27 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--campaign-id", required=True)
     parser.add_argument("--tag", default="v1.0.0-journal-repro")
     parser.add_argument("--submission-dir", default="output/submission")
+    parser.add_argument(
+        "--digest",
+        choices=["sha256", "blake2b", "xxh3"],
+        default="sha256",
+        help="Checksum algorithm; sha256 keeps the ARTIFACT_SHA256 file contract.",
+    )
     return parser.parse_args()
 
 
-def _sha256(path: Path) -> str:
-    h = hashlib.sha256()
-    h.update(path.read_bytes())
-    return h.hexdigest()
+def _digest_constructor(name: str):
+    if name == "xxh3":
+        if xxhash is None:
+            raise SystemExit("--digest xxh3 requires the optional 'xxhash' package")
+        return xxhash.xxh3_64
+    return name
+
+
+def _file_digest(path: Path, digest) -> str:
+    # Stream in fixed-size blocks instead of holding the whole artifact in memory.
+    with path.open("rb") as f:
+        return hashlib.file_digest(f, digest).hexdigest()
 
 
 def main() -> None:
@@ -54,13 +76,16 @@ def main() -> None:
     if missing:
         raise FileNotFoundError("missing required files: " + ", ".join(p.as_posix() for p in missing))
 
-    manifest = json.loads(pack_manifest.read_text(encoding="utf-8"))
+    manifest = json_loads(pack_manifest.read_bytes())
+
+    # hashlib releases the GIL while digesting, so the files hash in parallel.
+    digest = _digest_constructor(args.digest)
+    with ThreadPoolExecutor(max_workers=min(8, len(required))) as pool:
+        digests = list(pool.map(partial(_file_digest, digest=digest), required))
 
-    sha_out = submission_dir / f"ARTIFACT_SHA256_{args.campaign_id}.txt"
-    with sha_out.open("w", encoding="utf-8") as f:
-        for p in required:
-            rel = p.relative_to(ROOT).as_posix()
-            f.write(f"{_sha256(p)}  {rel}\n")
+    sha_out = submission_dir / f"ARTIFACT_{args.digest.upper()}_{args.campaign_id}.txt"
+    lines = [f"{digest}  {p.relative_to(ROOT).as_posix()}\n" for p, digest in zip(required, digests)]
+    sha_out.write_text("".join(lines), encoding="utf-8")
 
     release_body_out = submission_dir / f"GITHUB_RELEASE_BODY_{args.tag}.md"
     release_body = f"""# {args.tag}
@@ -78,7 +103,7 @@ Campaign-locked TR-E manuscript package release.
 - `output/submission/next_steps_{args.campaign_id}.md`
 - `output/submission/TABLE_FIGURE_INDEX_{args.campaign_id}.md`
 - `output/submission/MANUSCRIPT_PACK_MANIFEST_{args.campaign_id}.json`
-- `output/submission/ARTIFACT_SHA256_{args.campaign_id}.txt`
+- `output/submission/{sha_out.name}`
 
 ## Policy Lock
 - `N<=10`: exact-with-certificate
@@ -112,7 +137,7 @@ Use this body:
 - `output/submission/GITHUB_RELEASE_BODY_{args.tag}.md`
 
 Optional checksum attachment reference:
-- `output/submission/ARTIFACT_SHA256_{args.campaign_id}.txt`
+- `output/submission/{sha_out.name}`
 """
     push_out.write_text(push_text, encoding="utf-8")
 
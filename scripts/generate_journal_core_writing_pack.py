@@ -3,14 +3,38 @@ from __future__ import annotations
 
 import argparse
 import hashlib
-import json
+import math
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
-import pandas as pd
+from uavtre.io.json_codec import json_bytes, json_loads
+from writing_pack_common import index_rows, load_csv, write_text_if_changed
 
 ROOT = Path(__file__).resolve().parents[1]
+_ROOT_PREFIX = os.fspath(ROOT) + os.sep
+
+_SIZE_COLS = frozenset({"N"})
+_KPI_COLS = frozenset({"method", "N", "on_time_pct_mean", "total_tardiness_min_mean"})
+_GAP_COLS = frozenset({"method", "N", "gap_pct_mean"})
+_FEAS_COLS = frozenset({"method", "N", "feasible_rate"})
+_SIG_COLS = frozenset(
+    {
+        "metric",
+        "method_a",
+        "method_b",
+        "p_value_adj",
+        "effect_direction",
+        "effect_size",
+        "ci_low",
+        "ci_high",
+        "n_pairs",
+        "significant_flag",
+    }
+)
 
 
 def parse_args() -> argparse.Namespace:
@@ -42,62 +66,51 @@ def _fmt(x: float | int | None, nd: int = 2) -> str:
     return f"{v:.{nd}f}"
 
 
-def _write(path: Path, text: str) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(text, encoding="utf-8")
-
+def _sha256_and_size(path: Path) -> tuple[str, int]:
+    # One open + fstat gives the size; file_digest streams the hash without a full read.
+    with path.open("rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        return hashlib.file_digest(f, "sha256").hexdigest(), size
 
-def _sha256(path: Path) -> str:
-    h = hashlib.sha256()
-    h.update(path.read_bytes())
-    return h.hexdigest()
 
-
-def _load_csv(path: Path) -> pd.DataFrame:
-    if not path.exists():
-        raise FileNotFoundError(path)
-    return pd.read_csv(path)
-
-
-def _pick_row(df: pd.DataFrame, **filters: Any) -> pd.Series | None:
-    q = df
-    for k, v in filters.items():
-        q = q[q[k] == v]
-    if q.empty:
-        return None
-    return q.iloc[0]
+def _pick_row(index: dict[tuple, dict[str, Any]], *key: Any) -> dict[str, Any] | None:
+    return index.get(key)
 
 
 def _pick_sig(
-    df: pd.DataFrame,
+    index: dict[tuple, dict[str, Any]],
     method_left: str,
     method_right: str,
     metric: str,
-) -> pd.Series | None:
-    q = df[df["metric"] == metric]
-    if q.empty:
-        return None
-    lr = q[(q["method_a"] == method_left) & (q["method_b"] == method_right)]
-    if not lr.empty:
-        return lr.iloc[0]
-    rl = q[(q["method_a"] == method_right) & (q["method_b"] == method_left)]
-    if not rl.empty:
-        return rl.iloc[0]
-    return None
+) -> dict[str, Any] | None:
+    # Prefer the (left, right) orientation, then fall back to the flipped pair.
+    row = index.get((metric, method_left, method_right))
+    if row is None:
+        row = index.get((metric, method_right, method_left))
+    return row
 
 
-def _safe_value(row: pd.Series | None, col: str):
+def _safe_value(row: dict[str, Any] | None, col: str):
     if row is None:
         return None
+    return row.get(col)
+
+
+def _to_number(value: Any) -> float:
+    # pd.to_numeric(errors="coerce") for one cell.
     try:
-        return row[col]
-    except Exception:
-        return None
+        return float(value)
+    except (TypeError, ValueError):
+        return math.nan
+
 
+def _coverage(rows: list[dict[str, Any]]) -> str:
+    sizes = {int(n) for n in (_to_number(row.get("N")) for row in rows) if not math.isnan(n)}
+    return ",".join(str(n) for n in sorted(sizes)) if sizes else "NA"
 
-def _coverage(df: pd.DataFrame) -> str:
-    sizes = sorted(pd.to_numeric(df["N"], errors="coerce").dropna().astype(int).unique().tolist())
-    return ",".join(str(n) for n in sizes) if sizes else "NA"
+
+def _significant_count(rows: list[dict[str, Any]]) -> int:
+    return sum(1 for row in rows if _to_number(row.get("significant_flag")) == 1.0)
 
 
 def _table_metric_ref(path: Path, filters: dict[str, Any], metric_col: str) -> str:
@@ -105,11 +118,26 @@ def _table_metric_ref(path: Path, filters: dict[str, Any], metric_col: str) -> s
     return f"`{path.as_posix()}` [{', '.join(parts)}], metric=`{metric_col}`"
 
 
+@lru_cache(maxsize=None)
 def _relpath_text(path: Path) -> str:
+    # Lexical prefix strip: same result as relative_to(ROOT) without its parts
+    # comparison or the ValueError raised for paths outside the repository.
+    text = os.fspath(path)
+    if text.startswith(_ROOT_PREFIX):
+        text = text[len(_ROOT_PREFIX):]
+    elif text == _ROOT_PREFIX[:-1]:
+        return "."
+    return text.replace(os.sep, "/")
+
+
+def _list_csvs_rel(directory: Path) -> list[str]:
+    # One directory read; DirEntry.is_file() uses the type from the listing.
+    rel_dir = _relpath_text(directory)
     try:
-        return path.relative_to(ROOT).as_posix()
-    except ValueError:
-        return path.as_posix()
+        with os.scandir(directory) as it:
+            return sorted(f"{rel_dir}/{e.name}" for e in it if e.name.endswith(".csv") and e.is_file())
+    except FileNotFoundError:
+        return []
 
 
 def main() -> None:
@@ -137,47 +165,66 @@ def main() -> None:
     else:
         audit_path = ROOT / "outputs" / "audit" / f"journal_readiness_{args.campaign_id}.json"
 
-    audit = (
-        json.loads(audit_path.read_text(encoding="utf-8"))
-        if audit_path.exists()
-        else {"summary": {"overall_pass": False, "reason": f"missing audit: {_relpath_text(audit_path)}"}}
-    )
-
-    main_a = _load_csv(campaign_dir / "main_A_core" / "results_main.csv")
-    main_b = _load_csv(campaign_dir / "main_B_core" / "results_main.csv")
-    scal_a = _load_csv(campaign_dir / "scal_A_core" / "results_main.csv")
-    scal_b = _load_csv(campaign_dir / "scal_B_core" / "results_main.csv")
-
-    kpi_a = _load_csv(campaign_dir / "paper_A" / "table_main_kpi_summary.csv")
-    kpi_b = _load_csv(campaign_dir / "paper_B" / "table_main_kpi_summary.csv")
-    gap_a = _load_csv(campaign_dir / "paper_A" / "table_gap_summary.csv")
-    gap_b = _load_csv(campaign_dir / "paper_B" / "table_gap_summary.csv")
-    feas_a = _load_csv(campaign_dir / "paper_A" / "table_feasibility_rate.csv")
-    feas_b = _load_csv(campaign_dir / "paper_B" / "table_feasibility_rate.csv")
-
-    sig_a = _load_csv(campaign_dir / "main_A_core" / "results_significance.csv")
-    sig_b = _load_csv(campaign_dir / "main_B_core" / "results_significance.csv")
-
-    ort20_a = _pick_row(kpi_a, method="ortools_main", N=20)
-    ort20_b = _pick_row(kpi_b, method="ortools_main", N=20)
-    ort40_a = _pick_row(kpi_a, method="ortools_main", N=40)
-    ort40_b = _pick_row(kpi_b, method="ortools_main", N=40)
-    gap20_ort_a = _pick_row(gap_a, method="ortools_main", N=20)
-    gap20_ort_b = _pick_row(gap_b, method="ortools_main", N=20)
-    gap20_pyv_a = _pick_row(gap_a, method="pyvrp_baseline", N=20)
-    gap20_pyv_b = _pick_row(gap_b, method="pyvrp_baseline", N=20)
-    feas40_ort_a = _pick_row(feas_a, method="ortools_main", N=40)
-    feas40_ort_b = _pick_row(feas_b, method="ortools_main", N=40)
-    feas40_pyv_a = _pick_row(feas_a, method="pyvrp_baseline", N=40)
-    feas40_pyv_b = _pick_row(feas_b, method="pyvrp_baseline", N=40)
-
-    sig_a_runtime = _pick_sig(sig_a, "ortools_main", "pyvrp_baseline", "runtime_total_s")
-    sig_b_runtime = _pick_sig(sig_b, "ortools_main", "pyvrp_baseline", "runtime_total_s")
-    sig_a_tard = _pick_sig(sig_a, "ortools_main", "pyvrp_baseline", "total_tardiness_min")
-    sig_b_tard = _pick_sig(sig_b, "ortools_main", "pyvrp_baseline", "total_tardiness_min")
-
-    sig_a_count = int((pd.to_numeric(sig_a["significant_flag"], errors="coerce") == 1).sum())
-    sig_b_count = int((pd.to_numeric(sig_b["significant_flag"], errors="coerce") == 1).sum())
+    try:
+        audit = json_loads(audit_path.read_bytes())
+    except FileNotFoundError:
+        audit = {"summary": {"overall_pass": False, "reason": f"missing audit: {_relpath_text(audit_path)}"}}
+
+    # Only the columns the templates consume are parsed.
+    table_specs = {
+        "main_a": (campaign_dir / "main_A_core" / "results_main.csv", _SIZE_COLS),
+        "main_b": (campaign_dir / "main_B_core" / "results_main.csv", _SIZE_COLS),
+        "scal_a": (campaign_dir / "scal_A_core" / "results_main.csv", _SIZE_COLS),
+        "scal_b": (campaign_dir / "scal_B_core" / "results_main.csv", _SIZE_COLS),
+        "kpi_a": (campaign_dir / "paper_A" / "table_main_kpi_summary.csv", _KPI_COLS),
+        "kpi_b": (campaign_dir / "paper_B" / "table_main_kpi_summary.csv", _KPI_COLS),
+        "gap_a": (campaign_dir / "paper_A" / "table_gap_summary.csv", _GAP_COLS),
+        "gap_b": (campaign_dir / "paper_B" / "table_gap_summary.csv", _GAP_COLS),
+        "feas_a": (campaign_dir / "paper_A" / "table_feasibility_rate.csv", _FEAS_COLS),
+        "feas_b": (campaign_dir / "paper_B" / "table_feasibility_rate.csv", _FEAS_COLS),
+        "sig_a": (campaign_dir / "main_A_core" / "results_significance.csv", _SIG_COLS),
+        "sig_b": (campaign_dir / "main_B_core" / "results_significance.csv", _SIG_COLS),
+    }
+    # Independent files: overlap their reads.
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        tables = dict(zip(table_specs, pool.map(lambda spec: load_csv(*spec), table_specs.values())))
+
+    main_a, main_b = tables["main_a"], tables["main_b"]
+    scal_a, scal_b = tables["scal_a"], tables["scal_b"]
+    kpi_a, kpi_b = tables["kpi_a"], tables["kpi_b"]
+    gap_a, gap_b = tables["gap_a"], tables["gap_b"]
+    feas_a, feas_b = tables["feas_a"], tables["feas_b"]
+    sig_a, sig_b = tables["sig_a"], tables["sig_b"]
+
+    kpi_a_idx = index_rows(kpi_a, "method", "N")
+    kpi_b_idx = index_rows(kpi_b, "method", "N")
+    gap_a_idx = index_rows(gap_a, "method", "N")
+    gap_b_idx = index_rows(gap_b, "method", "N")
+    feas_a_idx = index_rows(feas_a, "method", "N")
+    feas_b_idx = index_rows(feas_b, "method", "N")
+
+    ort20_a = _pick_row(kpi_a_idx, "ortools_main", 20)
+    ort20_b = _pick_row(kpi_b_idx, "ortools_main", 20)
+    ort40_a = _pick_row(kpi_a_idx, "ortools_main", 40)
+    ort40_b = _pick_row(kpi_b_idx, "ortools_main", 40)
+    gap20_ort_a = _pick_row(gap_a_idx, "ortools_main", 20)
+    gap20_ort_b = _pick_row(gap_b_idx, "ortools_main", 20)
+    gap20_pyv_a = _pick_row(gap_a_idx, "pyvrp_baseline", 20)
+    gap20_pyv_b = _pick_row(gap_b_idx, "pyvrp_baseline", 20)
+    feas40_ort_a = _pick_row(feas_a_idx, "ortools_main", 40)
+    feas40_ort_b = _pick_row(feas_b_idx, "ortools_main", 40)
+    feas40_pyv_a = _pick_row(feas_a_idx, "pyvrp_baseline", 40)
+    feas40_pyv_b = _pick_row(feas_b_idx, "pyvrp_baseline", 40)
+
+    sig_a_idx = index_rows(sig_a, "metric", "method_a", "method_b")
+    sig_b_idx = index_rows(sig_b, "metric", "method_a", "method_b")
+    sig_a_runtime = _pick_sig(sig_a_idx, "ortools_main", "pyvrp_baseline", "runtime_total_s")
+    sig_b_runtime = _pick_sig(sig_b_idx, "ortools_main", "pyvrp_baseline", "runtime_total_s")
+    sig_a_tard = _pick_sig(sig_a_idx, "ortools_main", "pyvrp_baseline", "total_tardiness_min")
+    sig_b_tard = _pick_sig(sig_b_idx, "ortools_main", "pyvrp_baseline", "total_tardiness_min")
+
+    sig_a_count = _significant_count(sig_a)
+    sig_b_count = _significant_count(sig_b)
 
     cmd_regen_tables = (
         f"MAIN_PATH=outputs/campaigns/{args.campaign_id}/aggregated/main_A.csv "
@@ -196,89 +243,150 @@ def main() -> None:
         f"--campaign-root {campaign_root_arg}"
     )
 
-    claim_map = f"""# Claim-to-Evidence Map ({args.campaign_id})
+    summary = audit.get("summary", {})
+    campaign_tables = Path("outputs/campaigns") / args.campaign_id
+    # Every value the document templates interpolate, formatted once; values shared by
+    # several documents (the campaign id above all) are not recomputed.
+    ctx = {
+        "campaign_id": args.campaign_id,
+        "campaign_root": campaign_root_arg,
+        "submission_dir": submission_dir_arg,
+        "cov_main_a": _coverage(main_a),
+        "cov_main_b": _coverage(main_b),
+        "cov_scal_a": _coverage(scal_a),
+        "cov_scal_b": _coverage(scal_b),
+        "summary": summary,
+        "overall_pass": summary.get("overall_pass"),
+        "cmd_audit": cmd_audit,
+        "cmd_regen_tables": cmd_regen_tables,
+        "cmd_build_pack": cmd_build_pack,
+        "ref_c2": _table_metric_ref(
+            campaign_tables / "paper_A/table_main_kpi_summary.csv",
+            {"method": "ortools_main", "N": 20},
+            "on_time_pct_mean",
+        ),
+        "ref_c3": _table_metric_ref(
+            campaign_tables / "paper_A/table_feasibility_rate.csv",
+            {"method": "ortools_main", "N": 40},
+            "feasible_rate",
+        ),
+        "ref_c4": _table_metric_ref(
+            campaign_tables / "paper_A/table_gap_summary.csv",
+            {"method": "ortools_main", "N": 20},
+            "gap_pct_mean",
+        ),
+        "ort20_a_on_time": _fmt(_safe_value(ort20_a, "on_time_pct_mean")),
+        "ort20_b_on_time": _fmt(_safe_value(ort20_b, "on_time_pct_mean")),
+        "ort20_a_tard": _fmt(_safe_value(ort20_a, "total_tardiness_min_mean")),
+        "ort20_b_tard": _fmt(_safe_value(ort20_b, "total_tardiness_min_mean")),
+        "ort40_a_on_time": _fmt(_safe_value(ort40_a, "on_time_pct_mean")),
+        "ort40_b_on_time": _fmt(_safe_value(ort40_b, "on_time_pct_mean")),
+        "feas40_ort_a": _fmt(_safe_value(feas40_ort_a, "feasible_rate"), 3),
+        "feas40_ort_b": _fmt(_safe_value(feas40_ort_b, "feasible_rate"), 3),
+        "feas40_pyv_a": _fmt(_safe_value(feas40_pyv_a, "feasible_rate"), 3),
+        "feas40_pyv_b": _fmt(_safe_value(feas40_pyv_b, "feasible_rate"), 3),
+        "gap20_ort_a": _fmt(_safe_value(gap20_ort_a, "gap_pct_mean")),
+        "gap20_ort_b": _fmt(_safe_value(gap20_ort_b, "gap_pct_mean")),
+        "gap20_pyv_a": _fmt(_safe_value(gap20_pyv_a, "gap_pct_mean")),
+        "gap20_pyv_b": _fmt(_safe_value(gap20_pyv_b, "gap_pct_mean")),
+    }
+    for name, row in (
+        ("sig_a_runtime", sig_a_runtime),
+        ("sig_b_runtime", sig_b_runtime),
+        ("sig_a_tard", sig_a_tard),
+        ("sig_b_tard", sig_b_tard),
+    ):
+        ctx[f"{name}_p4"] = _fmt(_safe_value(row, "p_value_adj"), 4)
+        ctx[f"{name}_p6"] = _fmt(_safe_value(row, "p_value_adj"), 6)
+        ctx[f"{name}_dir"] = _safe_value(row, "effect_direction")
+        ctx[f"{name}_effect"] = _fmt(_safe_value(row, "effect_size"), 4)
+        ctx[f"{name}_ci_low"] = _fmt(_safe_value(row, "ci_low"), 4)
+        ctx[f"{name}_ci_high"] = _fmt(_safe_value(row, "ci_high"), 4)
+        ctx[f"{name}_n"] = _safe_value(row, "n_pairs")
+
+    claim_map = """# Claim-to-Evidence Map ({campaign_id})
 
 ## Scope
-- Campaign ID: `{args.campaign_id}`
-- Coverage A-main: `N={_coverage(main_a)}`
-- Coverage B-main: `N={_coverage(main_b)}`
-- Coverage A-scalability: `N={_coverage(scal_a)}`
-- Coverage B-scalability: `N={_coverage(scal_b)}`
-- Readiness summary: `{audit.get("summary", {})}`
+- Campaign ID: `{campaign_id}`
+- Coverage A-main: `N={cov_main_a}`
+- Coverage B-main: `N={cov_main_b}`
+- Coverage A-scalability: `N={cov_scal_a}`
+- Coverage B-scalability: `N={cov_scal_b}`
+- Readiness summary: `{summary}`
 
 ## Claim Matrix
 | Claim | Statement | Dataset Slice | Statistical Test | Table Row + Metric | Numeric Evidence | Reproducible Command | Status |
 |---|---|---|---|---|---|---|---|
-| C1 | Policy gate is satisfied by size regime. | `main_A_core`, `main_B_core`, `scal_A_core`, `scal_B_core` | Journal-readiness audit | `outputs/audit/journal_readiness_{args.campaign_id}.json`, summary fields | overall_pass=`{audit.get("summary", {}).get("overall_pass")}` | `{cmd_audit}` | Supported |
-| C2 | Family B stress reduces OR-Tools service quality at medium size. | `paper_A` vs `paper_B` at `method=ortools_main`, `N=20` | Wilcoxon+Holm available in significance files | {_table_metric_ref(Path("outputs/campaigns") / args.campaign_id / "paper_A/table_main_kpi_summary.csv", {"method": "ortools_main", "N": 20}, "on_time_pct_mean")} and `_B` peer table | on-time `{_fmt(_safe_value(ort20_a, "on_time_pct_mean"))}% -> {_fmt(_safe_value(ort20_b, "on_time_pct_mean"))}%`; tardiness `{_fmt(_safe_value(ort20_a, "total_tardiness_min_mean"))} -> {_fmt(_safe_value(ort20_b, "total_tardiness_min_mean"))}` min | `{cmd_regen_tables}` | Supported |
-| C3 | OR-Tools stays feasible at `N=40` while PyVRP drops in both families. | `paper_A/table_feasibility_rate.csv`, `paper_B/table_feasibility_rate.csv` | N/A (deterministic feasibility rates) | {_table_metric_ref(Path("outputs/campaigns") / args.campaign_id / "paper_A/table_feasibility_rate.csv", {"method": "ortools_main", "N": 40}, "feasible_rate")} and corresponding PyVRP rows | A: OR `{_fmt(_safe_value(feas40_ort_a, "feasible_rate"), 3)}` vs PY `{_fmt(_safe_value(feas40_pyv_a, "feasible_rate"), 3)}`; B: OR `{_fmt(_safe_value(feas40_ort_b, "feasible_rate"), 3)}` vs PY `{_fmt(_safe_value(feas40_pyv_b, "feasible_rate"), 3)}` | `{cmd_regen_tables}` | Supported |
-| C4 | At `N=20`, OR-Tools has tighter mean gap than PyVRP in A and B. | `paper_A/table_gap_summary.csv`, `paper_B/table_gap_summary.csv` | N/A (gap summary table) | {_table_metric_ref(Path("outputs/campaigns") / args.campaign_id / "paper_A/table_gap_summary.csv", {"method": "ortools_main", "N": 20}, "gap_pct_mean")} and corresponding PyVRP rows | A: `{_fmt(_safe_value(gap20_ort_a, "gap_pct_mean"))}%` vs `{_fmt(_safe_value(gap20_pyv_a, "gap_pct_mean"))}%`; B: `{_fmt(_safe_value(gap20_ort_b, "gap_pct_mean"))}%` vs `{_fmt(_safe_value(gap20_pyv_b, "gap_pct_mean"))}%` | `{cmd_regen_tables}` | Supported |
-| C5 | Inference is reported conservatively despite strong adjusted significance. | `main_A_core/results_significance.csv`, `main_B_core/results_significance.csv` | Wilcoxon, Holm-adjusted p, effect size, bootstrap CI | row `ortools_main vs pyvrp_baseline` for `runtime_total_s` and `total_tardiness_min` | A runtime p_holm=`{_fmt(_safe_value(sig_a_runtime, "p_value_adj"), 4)}`, dir=`{_safe_value(sig_a_runtime, "effect_direction")}`, n_pairs=`{_safe_value(sig_a_runtime, "n_pairs")}`; B runtime p_holm=`{_fmt(_safe_value(sig_b_runtime, "p_value_adj"), 4)}`, dir=`{_safe_value(sig_b_runtime, "effect_direction")}`, n_pairs=`{_safe_value(sig_b_runtime, "n_pairs")}` | `{cmd_build_pack}` | Supported with caveat |
+| C1 | Policy gate is satisfied by size regime. | `main_A_core`, `main_B_core`, `scal_A_core`, `scal_B_core` | Journal-readiness audit | `outputs/audit/journal_readiness_{campaign_id}.json`, summary fields | overall_pass=`{overall_pass}` | `{cmd_audit}` | Supported |
+| C2 | Family B stress reduces OR-Tools service quality at medium size. | `paper_A` vs `paper_B` at `method=ortools_main`, `N=20` | Wilcoxon+Holm available in significance files | {ref_c2} and `_B` peer table | on-time `{ort20_a_on_time}% -> {ort20_b_on_time}%`; tardiness `{ort20_a_tard} -> {ort20_b_tard}` min | `{cmd_regen_tables}` | Supported |
+| C3 | OR-Tools stays feasible at `N=40` while PyVRP drops in both families. | `paper_A/table_feasibility_rate.csv`, `paper_B/table_feasibility_rate.csv` | N/A (deterministic feasibility rates) | {ref_c3} and corresponding PyVRP rows | A: OR `{feas40_ort_a}` vs PY `{feas40_pyv_a}`; B: OR `{feas40_ort_b}` vs PY `{feas40_pyv_b}` | `{cmd_regen_tables}` | Supported |
+| C4 | At `N=20`, OR-Tools has tighter mean gap than PyVRP in A and B. | `paper_A/table_gap_summary.csv`, `paper_B/table_gap_summary.csv` | N/A (gap summary table) | {ref_c4} and corresponding PyVRP rows | A: `{gap20_ort_a}%` vs `{gap20_pyv_a}%`; B: `{gap20_ort_b}%` vs `{gap20_pyv_b}%` | `{cmd_regen_tables}` | Supported |
+| C5 | Inference is reported conservatively despite strong adjusted significance. | `main_A_core/results_significance.csv`, `main_B_core/results_significance.csv` | Wilcoxon, Holm-adjusted p, effect size, bootstrap CI | row `ortools_main vs pyvrp_baseline` for `runtime_total_s` and `total_tardiness_min` | A runtime p_holm=`{sig_a_runtime_p4}`, dir=`{sig_a_runtime_dir}`, n_pairs=`{sig_a_runtime_n}`; B runtime p_holm=`{sig_b_runtime_p4}`, dir=`{sig_b_runtime_dir}`, n_pairs=`{sig_b_runtime_n}` | `{cmd_build_pack}` | Supported with caveat |
 | C6 | `N=80` is reported as scalability-only with no bound/gap claims. | `scal_A_core/results_main.csv`, `scal_B_core/results_main.csv` | Journal-readiness policy gate | row filter `N>=80`, metric columns `claim_regime`, `gap_pct`, `best_bound` | claim_regime=`scalability_only`, bound/gap missing by policy | `{cmd_audit}` | Supported |
-"""
+""".format_map(ctx)
 
-    results_discussion = f"""# Results and Discussion Draft ({args.campaign_id})
+    results_discussion = """# Results and Discussion Draft ({campaign_id})
 
 ## 1. Protocol and Coverage
 The campaign covers both TW families (`A`, `B`), main sizes `N=10/20/40`, and scalability size `N=80` with policy-gated reporting.
 
 ## 2. Family-A vs Family-B Service Shift
-For OR-Tools at `N=20`, on-time performance shifts from `{_fmt(_safe_value(ort20_a, "on_time_pct_mean"))}%` (A) to `{_fmt(_safe_value(ort20_b, "on_time_pct_mean"))}%` (B), while total tardiness shifts from `{_fmt(_safe_value(ort20_a, "total_tardiness_min_mean"))}` to `{_fmt(_safe_value(ort20_b, "total_tardiness_min_mean"))}` minutes.
-At `N=40`, on-time shifts `{_fmt(_safe_value(ort40_a, "on_time_pct_mean"))}% -> {_fmt(_safe_value(ort40_b, "on_time_pct_mean"))}%`.
+For OR-Tools at `N=20`, on-time performance shifts from `{ort20_a_on_time}%` (A) to `{ort20_b_on_time}%` (B), while total tardiness shifts from `{ort20_a_tard}` to `{ort20_b_tard}` minutes.
+At `N=40`, on-time shifts `{ort40_a_on_time}% -> {ort40_b_on_time}%`.
 
 ## 3. Feasibility and Bound-Gap Evidence
-At `N=40`, OR-Tools remains feasible in A/B with rates `{_fmt(_safe_value(feas40_ort_a, "feasible_rate"), 3)}` and `{_fmt(_safe_value(feas40_ort_b, "feasible_rate"), 3)}`, while PyVRP rates are `{_fmt(_safe_value(feas40_pyv_a, "feasible_rate"), 3)}` and `{_fmt(_safe_value(feas40_pyv_b, "feasible_rate"), 3)}`.
-At `N=20`, OR-Tools gap is tighter than PyVRP in both families (A: `{_fmt(_safe_value(gap20_ort_a, "gap_pct_mean"))}%` vs `{_fmt(_safe_value(gap20_pyv_a, "gap_pct_mean"))}%`; B: `{_fmt(_safe_value(gap20_ort_b, "gap_pct_mean"))}%` vs `{_fmt(_safe_value(gap20_pyv_b, "gap_pct_mean"))}%`).
+At `N=40`, OR-Tools remains feasible in A/B with rates `{feas40_ort_a}` and `{feas40_ort_b}`, while PyVRP rates are `{feas40_pyv_a}` and `{feas40_pyv_b}`.
+At `N=20`, OR-Tools gap is tighter than PyVRP in both families (A: `{gap20_ort_a}%` vs `{gap20_pyv_a}%`; B: `{gap20_ort_b}%` vs `{gap20_pyv_b}%`).
 
 ## 4. Statistical Interpretation (Strict Reporting)
-Family A runtime comparison (`ortools_main` vs `pyvrp_baseline`): p_holm=`{_fmt(_safe_value(sig_a_runtime, "p_value_adj"), 6)}`, effect_direction=`{_safe_value(sig_a_runtime, "effect_direction")}`, effect_size=`{_fmt(_safe_value(sig_a_runtime, "effect_size"), 4)}`, CI=[`{_fmt(_safe_value(sig_a_runtime, "ci_low"), 4)}`, `{_fmt(_safe_value(sig_a_runtime, "ci_high"), 4)}`], n_pairs=`{_safe_value(sig_a_runtime, "n_pairs")}`.
-Family B runtime comparison (`ortools_main` vs `pyvrp_baseline`): p_holm=`{_fmt(_safe_value(sig_b_runtime, "p_value_adj"), 6)}`, effect_direction=`{_safe_value(sig_b_runtime, "effect_direction")}`, effect_size=`{_fmt(_safe_value(sig_b_runtime, "effect_size"), 4)}`, CI=[`{_fmt(_safe_value(sig_b_runtime, "ci_low"), 4)}`, `{_fmt(_safe_value(sig_b_runtime, "ci_high"), 4)}`], n_pairs=`{_safe_value(sig_b_runtime, "n_pairs")}`.
-Family A tardiness comparison: p_holm=`{_fmt(_safe_value(sig_a_tard, "p_value_adj"), 6)}`, effect_direction=`{_safe_value(sig_a_tard, "effect_direction")}`, n_pairs=`{_safe_value(sig_a_tard, "n_pairs")}`.
-Family B tardiness comparison: p_holm=`{_fmt(_safe_value(sig_b_tard, "p_value_adj"), 6)}`, effect_direction=`{_safe_value(sig_b_tard, "effect_direction")}`, n_pairs=`{_safe_value(sig_b_tard, "n_pairs")}`.
+Family A runtime comparison (`ortools_main` vs `pyvrp_baseline`): p_holm=`{sig_a_runtime_p6}`, effect_direction=`{sig_a_runtime_dir}`, effect_size=`{sig_a_runtime_effect}`, CI=[`{sig_a_runtime_ci_low}`, `{sig_a_runtime_ci_high}`], n_pairs=`{sig_a_runtime_n}`.
+Family B runtime comparison (`ortools_main` vs `pyvrp_baseline`): p_holm=`{sig_b_runtime_p6}`, effect_direction=`{sig_b_runtime_dir}`, effect_size=`{sig_b_runtime_effect}`, CI=[`{sig_b_runtime_ci_low}`, `{sig_b_runtime_ci_high}`], n_pairs=`{sig_b_runtime_n}`.
+Family A tardiness comparison: p_holm=`{sig_a_tard_p6}`, effect_direction=`{sig_a_tard_dir}`, n_pairs=`{sig_a_tard_n}`.
+Family B tardiness comparison: p_holm=`{sig_b_tard_p6}`, effect_direction=`{sig_b_tard_dir}`, n_pairs=`{sig_b_tard_n}`.
 
 ## 5. Scalability Policy
 All `N=80` statements must remain operational/scalability-only; no bound/gap claim is admissible by policy.
-"""
+""".format_map(ctx)
 
-    next_steps = f"""# Next Writing Steps ({args.campaign_id})
+    next_steps = """# Next Writing Steps ({campaign_id})
 
 1. Anchor Results section on C1/C3/C4/C6 and keep C5 conservative.
 2. Use C2 as stress-robustness result with direct A/B numerical deltas.
 3. Build figures from campaign tables only (no ad hoc recomputation).
-4. Keep all appendix reproducibility references campaign-locked to `{args.campaign_id}`.
+4. Keep all appendix reproducibility references campaign-locked to `{campaign_id}`.
 5. For transfer to another journal, reuse the same claim-evidence map and update only venue-specific template text.
-"""
+""".format_map(ctx)
 
-    table_index = f"""# Table and Figure Index ({args.campaign_id})
+    table_index = """# Table and Figure Index ({campaign_id})
 
 ## Campaign Source
-- Root: `outputs/campaigns/{args.campaign_id}`
-- Audit: `outputs/audit/journal_readiness_{args.campaign_id}.json`
+- Root: `outputs/campaigns/{campaign_id}`
+- Audit: `outputs/audit/journal_readiness_{campaign_id}.json`
 
 ## Core Tables
-- `outputs/campaigns/{args.campaign_id}/paper_A/table_main_kpi_summary.csv`
-- `outputs/campaigns/{args.campaign_id}/paper_A/table_gap_summary.csv`
-- `outputs/campaigns/{args.campaign_id}/paper_A/table_feasibility_rate.csv`
-- `outputs/campaigns/{args.campaign_id}/paper_A/table_scalability_raw.csv`
-- `outputs/campaigns/{args.campaign_id}/paper_B/table_main_kpi_summary.csv`
-- `outputs/campaigns/{args.campaign_id}/paper_B/table_gap_summary.csv`
-- `outputs/campaigns/{args.campaign_id}/paper_B/table_feasibility_rate.csv`
-- `outputs/campaigns/{args.campaign_id}/paper_B/table_scalability_raw.csv`
-- `outputs/campaigns/{args.campaign_id}/paper_combined/table_main_kpi_summary.csv`
-- `outputs/campaigns/{args.campaign_id}/paper_combined/table_gap_summary.csv`
-- `outputs/campaigns/{args.campaign_id}/paper_combined/table_feasibility_rate.csv`
-- `outputs/campaigns/{args.campaign_id}/paper_combined/table_scalability_raw.csv`
+- `outputs/campaigns/{campaign_id}/paper_A/table_main_kpi_summary.csv`
+- `outputs/campaigns/{campaign_id}/paper_A/table_gap_summary.csv`
+- `outputs/campaigns/{campaign_id}/paper_A/table_feasibility_rate.csv`
+- `outputs/campaigns/{campaign_id}/paper_A/table_scalability_raw.csv`
+- `outputs/campaigns/{campaign_id}/paper_B/table_main_kpi_summary.csv`
+- `outputs/campaigns/{campaign_id}/paper_B/table_gap_summary.csv`
+- `outputs/campaigns/{campaign_id}/paper_B/table_feasibility_rate.csv`
+- `outputs/campaigns/{campaign_id}/paper_B/table_scalability_raw.csv`
+- `outputs/campaigns/{campaign_id}/paper_combined/table_main_kpi_summary.csv`
+- `outputs/campaigns/{campaign_id}/paper_combined/table_gap_summary.csv`
+- `outputs/campaigns/{campaign_id}/paper_combined/table_feasibility_rate.csv`
+- `outputs/campaigns/{campaign_id}/paper_combined/table_scalability_raw.csv`
 
 ## Statistical Tables
-- `outputs/campaigns/{args.campaign_id}/main_A_core/results_significance.csv`
-- `outputs/campaigns/{args.campaign_id}/main_B_core/results_significance.csv`
+- `outputs/campaigns/{campaign_id}/main_A_core/results_significance.csv`
+- `outputs/campaigns/{campaign_id}/main_B_core/results_significance.csv`
 
 ## Figure Inputs
 - Performance bars: `paper_combined/table_main_kpi_summary.csv`
 - Gap plot: `paper_combined/table_gap_summary.csv`
 - Feasibility plot: `paper_combined/table_feasibility_rate.csv`
 - Scalability plot: `paper_combined/table_scalability_raw.csv`
-"""
+""".format_map(ctx)
 
     highlights = [
         "A/B full campaign evidence is locked to one reproducible campaign id.",
@@ -291,19 +399,19 @@ All `N=80` statements must remain operational/scalability-only; no bound/gap cla
         if len(item) > 85:
             raise ValueError(f"highlight {idx} exceeds 85 chars")
 
-    checklist = f"""# TR-E Pre-Submission Checklist ({args.campaign_id})
+    checklist = """# TR-E Pre-Submission Checklist ({campaign_id})
 
-- [x] Campaign outputs fixed to `outputs/campaigns/{args.campaign_id}/`.
-- [x] Audit passes and is archived at `outputs/audit/journal_readiness_{args.campaign_id}.json`.
-- [x] Claim map generated at `output/submission/claim_evidence_map_{args.campaign_id}.md`.
-- [x] Discussion draft generated at `output/submission/results_discussion_draft_{args.campaign_id}.md`.
-- [x] Next steps generated at `output/submission/next_steps_{args.campaign_id}.md`.
-- [x] Table index generated at `output/submission/TABLE_FIGURE_INDEX_{args.campaign_id}.md`.
-- [x] Manifest generated at `output/submission/MANUSCRIPT_PACK_MANIFEST_{args.campaign_id}.json`.
+- [x] Campaign outputs fixed to `outputs/campaigns/{campaign_id}/`.
+- [x] Audit passes and is archived at `outputs/audit/journal_readiness_{campaign_id}.json`.
+- [x] Claim map generated at `output/submission/claim_evidence_map_{campaign_id}.md`.
+- [x] Discussion draft generated at `output/submission/results_discussion_draft_{campaign_id}.md`.
+- [x] Next steps generated at `output/submission/next_steps_{campaign_id}.md`.
+- [x] Table index generated at `output/submission/TABLE_FIGURE_INDEX_{campaign_id}.md`.
+- [x] Manifest generated at `output/submission/MANUSCRIPT_PACK_MANIFEST_{campaign_id}.json`.
 - [x] Anonymous and camera-ready bundles regenerated with `--campaign-id`.
-"""
+""".format_map(ctx)
 
-    build_instructions = f"""# Build Instructions
+    build_instructions = """# Build Instructions
 
 ## 1) Environment bootstrap
 ```bash
@@ -315,7 +423,7 @@ pip install -e .
 
 ## 2) Run/refresh full campaign (CPU-sharded, 12 shards)
 ```bash
-CAMPAIGN_ID={args.campaign_id} NUM_SHARDS=12 MAX_CASES=0 \\
+CAMPAIGN_ID={campaign_id} NUM_SHARDS=12 MAX_CASES=0 \\
 RUN_STAGE1_CORE=1 RUN_STAGE2_ROBUST=1 \\
 PYTHONPATH=src ./scripts/run_journal_v3_robust.sh
 ```
@@ -323,59 +431,57 @@ PYTHONPATH=src ./scripts/run_journal_v3_robust.sh
 ## 3) Run campaign readiness audit
 ```bash
 PYTHONPATH=src .venv/bin/python scripts/audit_journal_readiness.py \\
-  --campaign-id {args.campaign_id} \\
-  --campaign-root {campaign_root_arg} \\
-  --json-out outputs/audit/journal_readiness_{args.campaign_id}.json \\
+  --campaign-id {campaign_id} \\
+  --campaign-root {campaign_root} \\
+  --json-out outputs/audit/journal_readiness_{campaign_id}.json \\
   --fail-on-critical --fail-on-high
 ```
 
 ## 4) Build manuscript package + review bundles
 ```bash
 ./scripts/build_manuscript_pack.sh \\
-  --campaign-id {args.campaign_id} \\
-  --campaign-root {campaign_root_arg} \\
-  --submission-dir {submission_dir_arg}
+  --campaign-id {campaign_id} \\
+  --campaign-root {campaign_root} \\
+  --submission-dir {submission_dir}
 ```
 
 ## 5) Command provenance
-- Campaign run plan: `outputs/campaigns/{args.campaign_id}/RUN_PLAN.json`
-- Command history: `outputs/campaigns/{args.campaign_id}/COMMAND_LOG.csv`
-- Environment snapshot: `outputs/campaigns/{args.campaign_id}/ENV_SNAPSHOT.json`
-- Launcher and stage logs: `outputs/campaigns/{args.campaign_id}/logs/*.log`
-"""
+- Campaign run plan: `outputs/campaigns/{campaign_id}/RUN_PLAN.json`
+- Command history: `outputs/campaigns/{campaign_id}/COMMAND_LOG.csv`
+- Environment snapshot: `outputs/campaigns/{campaign_id}/ENV_SNAPSHOT.json`
+- Launcher and stage logs: `outputs/campaigns/{campaign_id}/logs/*.log`
+""".format_map(ctx)
 
-    cover_letter = f"""Dear Editor,
+    cover_letter = """Dear Editor,
 
 Please consider our manuscript for Transportation Research Part E.
 
-The submission reports campaign-locked, reproducible evidence from `{args.campaign_id}` for reliability-aware multi-UAV pickup and delivery with communication-risk and soft time-window penalties. Claims follow a strict size-regime policy (`N<=10` exact with certificate, `N=20/40` bound-gap, `N=80` scalability-only).
+The submission reports campaign-locked, reproducible evidence from `{campaign_id}` for reliability-aware multi-UAV pickup and delivery with communication-risk and soft time-window penalties. Claims follow a strict size-regime policy (`N<=10` exact with certificate, `N=20/40` bound-gap, `N=80` scalability-only).
 
 All manuscript tables, claim mapping, and review bundles are generated directly from code and archived manifests/logs.
 
 Sincerely,
 Corresponding Author
-"""
-
-    _write(out_dir / f"claim_evidence_map_{args.campaign_id}.md", claim_map)
-    _write(out_dir / f"results_discussion_draft_{args.campaign_id}.md", results_discussion)
-    _write(out_dir / f"next_steps_{args.campaign_id}.md", next_steps)
-    _write(out_dir / f"TABLE_FIGURE_INDEX_{args.campaign_id}.md", table_index)
-    _write(out_dir / "proposal_highlights.txt", "\n".join(highlights) + "\n")
-    _write(out_dir / "cover_letter_draft.txt", cover_letter)
-    _write(out_dir / "tr_e_presubmission_checklist.md", checklist)
-    _write(out_dir / "build_instructions.md", build_instructions)
+""".format_map(ctx)
+
+    documents = [
+        (out_dir / f"claim_evidence_map_{args.campaign_id}.md", claim_map),
+        (out_dir / f"results_discussion_draft_{args.campaign_id}.md", results_discussion),
+        (out_dir / f"next_steps_{args.campaign_id}.md", next_steps),
+        (out_dir / f"TABLE_FIGURE_INDEX_{args.campaign_id}.md", table_index),
+        (out_dir / "proposal_highlights.txt", "\n".join(highlights) + "\n"),
+        (out_dir / "cover_letter_draft.txt", cover_letter),
+        (out_dir / "tr_e_presubmission_checklist.md", checklist),
+        (out_dir / "build_instructions.md", build_instructions),
+    ]
+    # All documents share out_dir: create it once, then overlap the independent writes.
+    # Documents whose text is unchanged are not rewritten (the manifest is, for its timestamp).
+    out_dir.mkdir(parents=True, exist_ok=True)
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        list(pool.map(lambda doc: write_text_if_changed(*doc), documents))
 
     generated_at = datetime.now(timezone.utc).isoformat()
-    artifact_paths = [
-        out_dir / f"claim_evidence_map_{args.campaign_id}.md",
-        out_dir / f"results_discussion_draft_{args.campaign_id}.md",
-        out_dir / f"next_steps_{args.campaign_id}.md",
-        out_dir / f"TABLE_FIGURE_INDEX_{args.campaign_id}.md",
-        out_dir / "proposal_highlights.txt",
-        out_dir / "cover_letter_draft.txt",
-        out_dir / "tr_e_presubmission_checklist.md",
-        out_dir / "build_instructions.md",
-    ]
+    artifact_paths = [path for path, _ in documents]
 
     manifest = {
         "generated_at_utc": generated_at,
@@ -390,11 +496,9 @@ Corresponding Author
             "source": _relpath_text(campaign_dir / "RUN_PLAN.json"),
         },
         "source_tables": {
-            "paper_A": sorted(str(p.relative_to(ROOT)) for p in (campaign_dir / "paper_A").glob("*.csv")),
-            "paper_B": sorted(str(p.relative_to(ROOT)) for p in (campaign_dir / "paper_B").glob("*.csv")),
-            "paper_combined": sorted(
-                str(p.relative_to(ROOT)) for p in (campaign_dir / "paper_combined").glob("*.csv")
-            ),
+            "paper_A": _list_csvs_rel(campaign_dir / "paper_A"),
+            "paper_B": _list_csvs_rel(campaign_dir / "paper_B"),
+            "paper_combined": _list_csvs_rel(campaign_dir / "paper_combined"),
         },
         "significance_rows": {
             "family_A": int(len(sig_a)),
@@ -412,39 +516,34 @@ Corresponding Author
     }
 
     for path in artifact_paths:
-        if path.exists():
-            manifest["artifacts"].append(
-                {
-                    "path": path.relative_to(ROOT).as_posix(),
-                    "sha256": _sha256(path),
-                    "bytes": path.stat().st_size,
-                }
-            )
+        try:
+            digest, size = _sha256_and_size(path)
+        except FileNotFoundError:
+            continue
+        manifest["artifacts"].append(
+            {
+                "path": _relpath_text(path),
+                "sha256": digest,
+                "bytes": size,
+            }
+        )
 
     manifest_path = out_dir / f"MANUSCRIPT_PACK_MANIFEST_{args.campaign_id}.json"
-    _write(manifest_path, json.dumps(manifest, indent=2))
-
+    # The self entry describes the manifest as it was before that entry was added. Hash
+    # that serialization in memory so the file itself is written only once.
+    draft = json_bytes(manifest)
     manifest["artifacts"].append(
         {
-            "path": manifest_path.relative_to(ROOT).as_posix(),
-            "sha256": _sha256(manifest_path),
-            "bytes": manifest_path.stat().st_size,
+            "path": _relpath_text(manifest_path),
+            "sha256": hashlib.sha256(draft).hexdigest(),
+            "bytes": len(draft),
         }
     )
-    _write(manifest_path, json.dumps(manifest, indent=2))
+    manifest_path.write_bytes(json_bytes(manifest))
 
     print("written:")
-    for p in [
-        out_dir / f"claim_evidence_map_{args.campaign_id}.md",
-        out_dir / f"results_discussion_draft_{args.campaign_id}.md",
-        out_dir / f"next_steps_{args.campaign_id}.md",
-        out_dir / f"TABLE_FIGURE_INDEX_{args.campaign_id}.md",
-        manifest_path,
-        out_dir / "proposal_highlights.txt",
-        out_dir / "cover_letter_draft.txt",
-        out_dir / "tr_e_presubmission_checklist.md",
-        out_dir / "build_instructions.md",
-    ]:
+    # The manifest is listed right after the four campaign-named documents.
+    for p in [*artifact_paths[:4], manifest_path, *artifact_paths[4:]]:
         print(p)
 
 
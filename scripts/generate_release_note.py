@@ -2,14 +2,18 @@
 from __future__ import annotations
 
 import argparse
-import json
 from pathlib import Path
+from typing import Any
 
-import pandas as pd
-
+from uavtre.io.json_codec import json_loads
+from writing_pack_common import index_rows, load_csv, write_text_if_changed
 
 ROOT = Path(__file__).resolve().parents[1]
 
+_KPI_COLS = frozenset({"method", "N", "on_time_pct_mean", "total_tardiness_min_mean"})
+_FEAS_COLS = frozenset({"method", "N", "feasible_rate"})
+_GAP_COLS = frozenset({"method", "N", "gap_pct_mean"})
+
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Generate campaign-scoped release note.")
@@ -20,13 +24,17 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
-def _pick(df: pd.DataFrame, **filters) -> pd.Series:
-    q = df
-    for k, v in filters.items():
-        q = q[q[k] == v]
-    if q.empty:
+def _load_table(path: Path, usecols: frozenset[str]) -> dict[tuple, dict[str, Any]]:
+    return index_rows(load_csv(path, usecols), "method", "N")
+
+
+def _pick(index: dict[tuple, dict[str, Any]], method: str, n: int) -> dict[str, Any]:
+    # Tables are indexed on (method, N), so the lookup is one dict probe.
+    row = index.get((method, n))
+    if row is None:
+        filters = {"method": method, "N": n}
         raise ValueError(f"missing row for filters={filters}")
-    return q.iloc[0]
+    return row
 
 
 def main() -> None:
@@ -51,25 +59,26 @@ def main() -> None:
     else:
         audit_path = ROOT / "outputs" / "audit" / f"journal_readiness_{args.campaign_id}.json"
 
-    audit = json.loads(audit_path.read_text(encoding="utf-8"))
-
-    kpi_a = pd.read_csv(campaign_dir / "paper_A" / "table_main_kpi_summary.csv")
-    kpi_b = pd.read_csv(campaign_dir / "paper_B" / "table_main_kpi_summary.csv")
-    feas_a = pd.read_csv(campaign_dir / "paper_A" / "table_feasibility_rate.csv")
-    feas_b = pd.read_csv(campaign_dir / "paper_B" / "table_feasibility_rate.csv")
-    gap_a = pd.read_csv(campaign_dir / "paper_A" / "table_gap_summary.csv")
-    gap_b = pd.read_csv(campaign_dir / "paper_B" / "table_gap_summary.csv")
-
-    ort20a = _pick(kpi_a, method="ortools_main", N=20)
-    ort20b = _pick(kpi_b, method="ortools_main", N=20)
-    fe40oa = _pick(feas_a, method="ortools_main", N=40)
-    fe40ob = _pick(feas_b, method="ortools_main", N=40)
-    fe40pa = _pick(feas_a, method="pyvrp_baseline", N=40)
-    fe40pb = _pick(feas_b, method="pyvrp_baseline", N=40)
-    g20oa = _pick(gap_a, method="ortools_main", N=20)
-    g20ob = _pick(gap_b, method="ortools_main", N=20)
-    g20pa = _pick(gap_a, method="pyvrp_baseline", N=20)
-    g20pb = _pick(gap_b, method="pyvrp_baseline", N=20)
+    audit = json_loads(audit_path.read_bytes())
+
+    # Same loaders as the writing pack, which reads these tables just before this script runs.
+    kpi_a = _load_table(campaign_dir / "paper_A" / "table_main_kpi_summary.csv", _KPI_COLS)
+    kpi_b = _load_table(campaign_dir / "paper_B" / "table_main_kpi_summary.csv", _KPI_COLS)
+    feas_a = _load_table(campaign_dir / "paper_A" / "table_feasibility_rate.csv", _FEAS_COLS)
+    feas_b = _load_table(campaign_dir / "paper_B" / "table_feasibility_rate.csv", _FEAS_COLS)
+    gap_a = _load_table(campaign_dir / "paper_A" / "table_gap_summary.csv", _GAP_COLS)
+    gap_b = _load_table(campaign_dir / "paper_B" / "table_gap_summary.csv", _GAP_COLS)
+
+    ort20a = _pick(kpi_a, "ortools_main", 20)
+    ort20b = _pick(kpi_b, "ortools_main", 20)
+    fe40oa = _pick(feas_a, "ortools_main", 40)
+    fe40ob = _pick(feas_b, "ortools_main", 40)
+    fe40pa = _pick(feas_a, "pyvrp_baseline", 40)
+    fe40pb = _pick(feas_b, "pyvrp_baseline", 40)
+    g20oa = _pick(gap_a, "ortools_main", 20)
+    g20ob = _pick(gap_b, "ortools_main", 20)
+    g20pa = _pick(gap_a, "pyvrp_baseline", 20)
+    g20pb = _pick(gap_b, "pyvrp_baseline", 20)
 
     note = f"""# Release Note: v1.0.0-journal-repro (Campaign Locked)
 
@@ -108,7 +117,7 @@ def main() -> None:
 
     out = submission_dir / f"RELEASE_NOTE_{args.campaign_id}.md"
     out.parent.mkdir(parents=True, exist_ok=True)
-    out.write_text(note, encoding="utf-8")
+    write_text_if_changed(out, note)
     print(out)
 
 
@@ -2,6 +2,9 @@
 from __future__ import annotations
 
 import argparse
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 
 import pandas as pd
@@ -24,11 +27,11 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
-def _ensure_columns(df: pd.DataFrame, cols: list[str]) -> pd.DataFrame:
-    for c in cols:
-        if c not in df.columns:
-            df[c] = pd.NA
-    return df[cols]
+def _read_shard_csv(path: Path, cols: list[str]) -> pd.DataFrame:
+    # Project onto the schema while parsing: non-schema columns are never tokenized and missing
+    # ones are added per shard, so the concat already comes out in schema order.
+    wanted = frozenset(cols)
+    return pd.read_csv(path, usecols=lambda c: c in wanted).reindex(columns=cols)
 
 
 def main() -> None:
@@ -43,26 +46,25 @@ def main() -> None:
             f"expected at least {args.require_shards} shard dirs under {shards_root}, got {len(shard_dirs)}"
         )
 
-    main_parts: list[pd.DataFrame] = []
-    route_parts: list[pd.DataFrame] = []
+    main_paths = [p for p in (shard / "results_main.csv" for shard in shard_dirs) if p.exists()]
+    route_paths = [p for p in (shard / "results_routes.csv" for shard in shard_dirs) if p.exists()]
 
-    for shard in shard_dirs:
-        m = shard / "results_main.csv"
-        r = shard / "results_routes.csv"
-        if m.exists():
-            main_parts.append(pd.read_csv(m))
-        if r.exists():
-            route_parts.append(pd.read_csv(r))
-
-    if not main_parts:
+    if not main_paths:
         raise SystemExit(f"no shard results_main.csv found under {shards_root}")
 
-    merged_main = _ensure_columns(pd.concat(main_parts, ignore_index=True), RESULTS_MAIN_COLUMNS)
+    # Shard files are independent and read_csv's C parser releases the GIL while tokenizing,
+    # so every main and route read is queued up front. concat drains each result iterator and
+    # the shard frames are released as soon as it returns.
+    with ThreadPoolExecutor(max_workers=min(32, os.cpu_count() or 1)) as pool:
+        main_parts = pool.map(partial(_read_shard_csv, cols=RESULTS_MAIN_COLUMNS), main_paths)
+        route_parts = pool.map(partial(_read_shard_csv, cols=RESULTS_ROUTES_COLUMNS), route_paths)
+        merged_main = pd.concat(main_parts, ignore_index=True)
+        merged_routes = pd.concat(route_parts, ignore_index=True) if route_paths else None
+
     merged_main = merged_main.drop_duplicates(subset=["run_id", "method"], keep="first")
     merged_main.to_csv(out_dir / "results_main.csv", index=False)
 
-    if route_parts:
-        merged_routes = _ensure_columns(pd.concat(route_parts, ignore_index=True), RESULTS_ROUTES_COLUMNS)
+    if merged_routes is not None:
         merged_routes = merged_routes.drop_duplicates(
             subset=["run_id", "uav_id", "route_node_sequence"],
             keep="first",
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
 from pathlib import Path
 
 from uavtre.submit_v1.portal_pack_builder import check_pack
@@ -21,7 +22,7 @@ def parse_args() -> argparse.Namespace:
 
 def main() -> None:
     args = parse_args()
-    root = Path(__file__).resolve().parents[2]
+    root = Path(os.path.abspath(__file__)).parents[2]
     if args.pack:
         pack = Path(args.pack)
         if not pack.is_absolute():
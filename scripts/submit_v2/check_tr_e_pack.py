@@ -3,14 +3,16 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
 import sys
 from pathlib import Path
 
 
 def _ensure_src_on_path() -> Path:
-    root = Path(__file__).resolve().parents[2]
-    src = root / "src"
-    sys.path.insert(0, src.as_posix())
+    root = Path(os.path.abspath(__file__)).parents[2]
+    src = (root / "src").as_posix()
+    if src not in sys.path:
+        sys.path.insert(0, src)
     return root
 
 
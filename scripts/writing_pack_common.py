@@ -0,0 +1,76 @@
+"""CSV and text helpers shared by the writing-pack and release-note scripts."""
+from __future__ import annotations
+
+import csv
+import math
+import re
+from pathlib import Path
+from typing import Any
+
+# read_csv's default NA markers, so blank or NA cells render exactly as they did under pandas.
+NA_VALUES = frozenset(
+    {
+        "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan", "1.#IND", "1.#QNAN",
+        "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a", "nan", "null",
+    }
+)
+# The numeric spellings read_csv accepts. int()/float() alone are looser: they also take
+# "1_000" and non-ASCII digits, which read_csv leaves as text.
+_INT_RE = re.compile(r"[ \t]*[+-]?[0-9]+[ \t]*")
+_FLOAT_RE = re.compile(
+    r"[ \t]*[+-]?(?:(?:[0-9]+\.?[0-9]*|\.[0-9]+)(?:e[+-]?[0-9]+)?|inf(?:inity)?)[ \t]*",
+    re.IGNORECASE,
+)
+_BOOL_VALUES = {"True": True, "TRUE": True, "true": True, "False": False, "FALSE": False, "false": False}
+
+
+def write_text_if_changed(path: Path, text: str) -> bool:
+    # Leave an identical file untouched so its mtime, and any rebuild keyed on it, stays put.
+    try:
+        if path.read_text(encoding="utf-8") == text:
+            return False
+    except (FileNotFoundError, UnicodeDecodeError):
+        pass
+    path.write_text(text, encoding="utf-8")
+    return True
+
+
+def _convert_column(raw: list[str]) -> list[Any]:
+    # Same per-column inference as read_csv: int, else float (NA-bearing int columns
+    # widen to float), else bool, else text; NA markers become nan in every case.
+    present = [cell for cell in raw if cell not in NA_VALUES]
+    if all(_INT_RE.fullmatch(cell) for cell in present):
+        cast = int if len(present) == len(raw) else float
+    elif all(_FLOAT_RE.fullmatch(cell) for cell in present):
+        cast = float
+    elif all(cell in _BOOL_VALUES for cell in present):
+        cast = _BOOL_VALUES.__getitem__
+    else:
+        cast = str
+    return [math.nan if cell in NA_VALUES else cast(cell) for cell in raw]
+
+
+def load_csv(path: Path, usecols: frozenset[str] | None = None) -> list[dict[str, Any]]:
+    if not path.exists():
+        raise FileNotFoundError(path)
+    with path.open(newline="", encoding="utf-8-sig") as f:
+        reader = csv.reader(f)
+        header = next(reader, [])
+        records = [rec for rec in reader if rec]
+    # Convert column-wise (types are inferred per column), then hand back one dict per row.
+    columns = {
+        col: _convert_column([rec[i] if i < len(rec) else "" for rec in records])
+        for i, col in enumerate(header)
+        if usecols is None or col in usecols
+    }
+    if not columns:
+        return [{} for _ in records]
+    return [dict(zip(columns, values)) for values in zip(*columns.values())]
+
+
+def index_rows(rows: list[dict[str, Any]], *keys: str) -> dict[tuple, dict[str, Any]]:
+    # First row per key tuple, so each lookup is a dict probe instead of a scan.
+    index: dict[tuple, dict[str, Any]] = {}
+    for row in rows:
+        index.setdefault(tuple(row.get(k) for k in keys), row)
+    return index
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import argparse
+
+from ..io.json_codec import json_bytes
+from ..io.loaders import get_default_config_path
+
+
+def dumps_json(obj: object, *, pretty: bool = False) -> str:
+    # Indent only what a reviewer reads; machine-consumed metadata stays compact.
+    return json_bytes(obj, pretty=pretty).decode("utf-8")
+
+
+def add_common_args(parser: argparse.ArgumentParser) -> None:
+    # Flags every experiment CLI accepts; each CLI adds its own options after these.
+    parser.add_argument(
+        "--config",
+        type=str,
+        default=str(get_default_config_path()),
+        help="Path to base config JSON.",
+    )
+    parser.add_argument(
+        "--profile",
+        type=str,
+        default="main_table",
+        help="Profile name: quick | main_table | scalability.",
+    )
+    parser.add_argument(
+        "--profile-override",
+        type=str,
+        default=None,
+        help="Optional profile JSON override.",
+    )
+    parser.add_argument(
+        "--max-cases",
+        type=int,
+        default=0,
+        help="Optional hard cap for number of scenario cases.",
+    )
+    parser.add_argument(
+        "--benchmark-dir",
+        type=str,
+        default="benchmarks/frozen",
+        help="Frozen benchmark directory (read if files exist).",
+    )
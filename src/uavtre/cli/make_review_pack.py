@@ -1,14 +1,25 @@
 from __future__ import annotations
 
 import argparse
-import json
+import os
 import re
 import shutil
 from datetime import datetime, timezone
 from pathlib import Path
 
+from ._common import dumps_json
 
-ROOT = Path(__file__).resolve().parents[3]
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None
+
+
+ROOT = Path(os.path.abspath(__file__)).parents[3]
+# Python 3.12+ exposes the Linux reflink ioctl; without it every copy goes through copy2.
+_FICLONE = getattr(fcntl, "FICLONE", None)
+_ANON_NAME_RE = re.compile(r'\{ name = "[^"]+" \}')
+_ANON_URL = "https://github.com/anonymous/uav_tr_e_project"
 
 
 def parse_args() -> argparse.Namespace:
@@ -49,15 +60,44 @@ def _display_path(path: Path) -> str:
         return path.as_posix()
 
 
+def _count_by_suffix(root: Path, suffixes: tuple[str, ...]) -> dict[str, int]:
+    # One walk answers every rglob(f"*{suffix}") count for the tree. Like rglob, names of
+    # directories count too and symlinked directories are listed but not descended into.
+    counts = dict.fromkeys(suffixes, 0)
+    for _, dirnames, filenames in os.walk(root):
+        for names in (dirnames, filenames):
+            for name in names:
+                for suffix in suffixes:
+                    if name.endswith(suffix):
+                        counts[suffix] += 1
+    return counts
+
+
+def _clone_or_copy2(src: str | Path, dst: str | Path) -> str | Path:
+    # On btrfs/XFS a reflink shares the source extents, so even large benchmark trees copy
+    # without moving data. Anywhere else copy2 is used, which on Linux already hands the
+    # data copy to the kernel (sendfile) rather than a Python read/write loop.
+    if _FICLONE is not None:
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+        except OSError:
+            pass
+        else:
+            shutil.copystat(src, dst)
+            return dst
+    return shutil.copy2(src, dst)
+
+
 def _copy_file(src: Path, dst: Path) -> None:
     dst.parent.mkdir(parents=True, exist_ok=True)
     if src.exists():
-        shutil.copy2(src, dst)
+        _clone_or_copy2(src, dst)
 
 
 def _copy_tree(src: Path, dst: Path) -> None:
     if src.exists():
-        shutil.copytree(src, dst, dirs_exist_ok=True)
+        shutil.copytree(src, dst, dirs_exist_ok=True, copy_function=_clone_or_copy2)
 
 
 def _write_anonymous_metadata(bundle_dir: Path) -> None:
@@ -103,16 +143,8 @@ def _write_anonymous_metadata(bundle_dir: Path) -> None:
     anon_pyproject = bundle_dir / "pyproject.toml"
     if anon_pyproject.exists():
         text = anon_pyproject.read_text(encoding="utf-8")
-        text = re.sub(
-            r'\{ name = "[^"]+" \}',
-            '{ name = "Anonymous Authors" }',
-            text,
-            count=1,
-        )
-        text = text.replace(
-            "https://github.com/anonymous/uav_tr_e_project",
-            "https://anonymous.invalid/repository",
-        )
+        text = _ANON_NAME_RE.sub('{ name = "Anonymous Authors" }', text, count=1)
+        text = text.replace(_ANON_URL, "https://anonymous.invalid/repository")
         anon_pyproject.write_text(text, encoding="utf-8")
 
 
@@ -126,7 +158,12 @@ def _copy_submission_artifacts(bundle_dir: Path, campaign_id: str) -> list[str]:
     src_submission = ROOT / "output" / "submission"
     dst_submission = bundle_dir / "output" / "submission"
     copied: list[str] = []
-    if not src_submission.exists():
+    # One listing answers every candidate; exists() follows symlinks, so a dangling
+    # link still counts as absent.
+    try:
+        with os.scandir(src_submission) as it:
+            present = {e.name for e in it if not e.is_symlink() or os.path.exists(e.path)}
+    except (FileNotFoundError, NotADirectoryError):
         return copied
 
     candidates = [
@@ -143,11 +180,13 @@ def _copy_submission_artifacts(bundle_dir: Path, campaign_id: str) -> list[str]:
     ]
 
     for name in candidates:
-        src = src_submission / name
-        if src.exists():
-            dst = dst_submission / name
-            _copy_file(src, dst)
-            copied.append(str(dst.relative_to(bundle_dir)))
+        if name not in present:
+            continue
+        if not copied:
+            dst_submission.mkdir(parents=True, exist_ok=True)
+        dst = dst_submission / name
+        _clone_or_copy2(src_submission / name, dst)
+        copied.append(str(dst.relative_to(bundle_dir)))
 
     return copied
 
@@ -170,6 +209,9 @@ def _copy_campaign_artifacts(
 
     copied_submission = _copy_submission_artifacts(bundle_dir, campaign_id)
 
+    campaign_counts = _count_by_suffix(campaign_dir, (".json", ".csv"))
+    bundle_counts = _count_by_suffix(dst_campaign, (".json", ".csv"))
+
     source_manifest = campaign_dir / "CAMPAIGN_MANIFEST.json"
     source_run_plan = campaign_dir / "RUN_PLAN.json"
     source_env = campaign_dir / "ENV_SNAPSHOT.json"
@@ -186,15 +228,15 @@ def _copy_campaign_artifacts(
             "COMMAND_LOG.csv": source_cmd.exists(),
         },
         "include_logs": int(include_logs),
-        "campaign_files_json": len(list(campaign_dir.rglob("*.json"))),
-        "campaign_files_csv": len(list(campaign_dir.rglob("*.csv"))),
-        "bundle_campaign_json": len(list(dst_campaign.rglob("*.json"))),
-        "bundle_campaign_csv": len(list(dst_campaign.rglob("*.csv"))),
+        "campaign_files_json": campaign_counts[".json"],
+        "campaign_files_csv": campaign_counts[".csv"],
+        "bundle_campaign_json": bundle_counts[".json"],
+        "bundle_campaign_csv": bundle_counts[".csv"],
         "submission_artifacts": copied_submission,
         "submission_artifact_count": len(copied_submission),
     }
     (bundle_dir / "BUNDLE_MANIFEST.json").write_text(
-        json.dumps(manifest, indent=2),
+        dumps_json(manifest, pretty=True),
         encoding="utf-8",
     )
     return manifest
@@ -255,11 +297,11 @@ def _copy_best_available_artifacts(bundle_dir: Path) -> dict:
         "generated_at_utc": datetime.now(timezone.utc).isoformat(),
         "copied_benchmark_dirs": copied_bench_dirs,
         "copied_output_dirs": copied_out_dirs,
-        "benchmark_json_count": len(list((bundle_dir / "benchmarks").rglob("*.json"))),
-        "output_csv_count": len(list((bundle_dir / "outputs").rglob("*.csv"))),
+        "benchmark_json_count": _count_by_suffix(bundle_dir / "benchmarks", (".json",))[".json"],
+        "output_csv_count": _count_by_suffix(bundle_dir / "outputs", (".csv",))[".csv"],
     }
     (bundle_dir / "BUNDLE_MANIFEST.json").write_text(
-        json.dumps(manifest, indent=2),
+        dumps_json(manifest, pretty=True),
         encoding="utf-8",
     )
     return manifest
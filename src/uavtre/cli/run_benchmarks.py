@@ -12,7 +12,8 @@ from datetime import datetime, timezone
 from pathlib import Path
 
 from ..experiments.runner import run_experiment_matrix
-from ..io.loaders import get_default_config_path, load_project_config
+from ..io.loaders import load_project_config
+from ._common import add_common_args, dumps_json
 
 try:
     import fcntl
@@ -20,16 +21,26 @@ except ImportError:  # pragma: no cover
     fcntl = None
 
 
+COMMAND_LOG_FIELDS = (
+    "timestamp_utc",
+    "campaign_id",
+    "stage_tag",
+    "profile",
+    "shard_index",
+    "num_shards",
+    "resume",
+    "command",
+    "output",
+    "benchmark_dir",
+)
+
+
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         description="Generate/refresh frozen benchmarks and run experiment profile."
     )
-    parser.add_argument("--config", type=str, default=str(get_default_config_path()))
-    parser.add_argument("--profile", type=str, default="main_table")
+    add_common_args(parser)
     parser.add_argument("--output", type=str, default="outputs/results_main.csv")
-    parser.add_argument("--benchmark-dir", type=str, default="benchmarks/frozen")
-    parser.add_argument("--max-cases", type=int, default=0)
-    parser.add_argument("--profile-override", type=str, default=None)
     parser.add_argument("--shard-index", type=int, default=0)
     parser.add_argument("--num-shards", type=int, default=1)
     parser.add_argument("--campaign-id", type=str, default=None)
@@ -48,8 +59,11 @@ def _locked_file(path: Path, mode: str):
         try:
             yield f
         finally:
+            # flush() under the lock is what makes the write visible to the next holder;
+            # fsync only adds crash durability, so it is opt-in.
             f.flush()
-            os.fsync(f.fileno())
+            if os.environ.get("UAVTRE_FSYNC") == "1":
+                os.fsync(f.fileno())
             if fcntl is not None:
                 fcntl.flock(f.fileno(), fcntl.LOCK_UN)
 
@@ -62,9 +76,9 @@ def _command_text() -> str:
     return " ".join(shlex.quote(x) for x in sys.argv)
 
 
-def _collect_env_snapshot() -> dict:
+def _collect_env_snapshot(generated_at_utc: str) -> dict:
     return {
-        "generated_at_utc": _utc_now(),
+        "generated_at_utc": generated_at_utc,
         "python": sys.version,
         "platform": platform.platform(),
         "executable": sys.executable,
@@ -73,6 +87,8 @@ def _collect_env_snapshot() -> dict:
 
 def _upsert_json_list_file(path: Path, root_key: str, row: dict) -> None:
     with _locked_file(path, "a+") as f:
+        # Stamped once the lock is held; a new file's created and updated times coincide.
+        now = _utc_now()
         f.seek(0)
         raw = f.read().strip()
         if raw:
@@ -80,39 +96,24 @@ def _upsert_json_list_file(path: Path, root_key: str, row: dict) -> None:
         else:
             payload = {
                 root_key: [],
-                "created_at_utc": _utc_now(),
+                "created_at_utc": now,
             }
 
         payload.setdefault(root_key, [])
         payload[root_key].append(row)
-        payload["updated_at_utc"] = _utc_now()
+        payload["updated_at_utc"] = now
 
         f.seek(0)
         f.truncate()
-        json.dump(payload, f, indent=2)
+        f.write(dumps_json(payload))
 
 
 def _append_command_log(path: Path, row: dict) -> None:
-    with _locked_file(path, "a+") as f:
-        f.seek(0)
-        has_content = bool(f.read(1))
-        f.seek(0, os.SEEK_END)
-
-        writer = csv.DictWriter(
-            f,
-            fieldnames=[
-                "timestamp_utc",
-                "campaign_id",
-                "stage_tag",
-                "profile",
-                "shard_index",
-                "num_shards",
-                "resume",
-                "command",
-                "output",
-                "benchmark_dir",
-            ],
-        )
+    with _locked_file(path, "a") as f:
+        # Append mode already sits at EOF; an empty file (checked under the lock) needs a header.
+        has_content = os.fstat(f.fileno()).st_size > 0
+
+        writer = csv.DictWriter(f, fieldnames=COMMAND_LOG_FIELDS)
         if not has_content:
             writer.writeheader()
         writer.writerow(row)
@@ -129,13 +130,15 @@ def _write_campaign_metadata_before(args: argparse.Namespace) -> None:
     if camp_dir is None:
         return
 
+    # One timestamp per invocation, so the snapshot, run plan and command log rows line up.
+    now = _utc_now()
     env_path = camp_dir / "ENV_SNAPSHOT.json"
     if not env_path.exists():
         env_path.parent.mkdir(parents=True, exist_ok=True)
-        env_path.write_text(json.dumps(_collect_env_snapshot(), indent=2), encoding="utf-8")
+        env_path.write_text(dumps_json(_collect_env_snapshot(now), pretty=True), encoding="utf-8")
 
     run_plan_row = {
-        "timestamp_utc": _utc_now(),
+        "timestamp_utc": now,
         "campaign_id": args.campaign_id,
         "stage_tag": args.stage_tag,
         "profile": args.profile,
@@ -153,7 +156,7 @@ def _write_campaign_metadata_before(args: argparse.Namespace) -> None:
     _append_command_log(
         camp_dir / "COMMAND_LOG.csv",
         {
-            "timestamp_utc": _utc_now(),
+            "timestamp_utc": now,
             "campaign_id": args.campaign_id,
             "stage_tag": args.stage_tag,
             "profile": args.profile,
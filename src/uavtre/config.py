@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import copy
+import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict
 
@@ -7,7 +10,16 @@ from .io.loaders import get_default_config_path, load_project_config
 
 
 def load_config(path: str | Path) -> Dict[str, Any]:
-    cfg = load_project_config(path)
+    # Keyed on the file's mtime, so an edited config is re-read on the next call.
+    path_str = os.path.abspath(path)
+    cached = _load_config_cached(path_str, os.stat(path_str).st_mtime_ns)
+    # The cached dict holds lists and dicts; hand out a copy so callers cannot alter it.
+    return copy.deepcopy(cached)
+
+
+@lru_cache(maxsize=32)
+def _load_config_cached(path_str: str, mtime_ns: int) -> Dict[str, Any]:
+    cfg = load_project_config(path_str)
     return {
         "area_km": cfg.area_km,
         "depot_location": cfg.depot_location,
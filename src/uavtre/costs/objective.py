@@ -26,11 +26,12 @@ def build_edge_data(
     risk: np.ndarray,
     cost_spec: CostSpec,
 ) -> EdgeData:
-    energy = cost_spec.energy_per_m * distance_m
-    # Arc-level objective term: energy + communication-risk contribution.
-    cost = cost_spec.cost_scale * (
-        energy + cost_spec.lambda_out * cost_spec.risk_scale * risk
-    )
+    energy = np.multiply(distance_m, cost_spec.energy_per_m)
+    # Arc-level objective term: energy + communication-risk contribution. Built in one
+    # buffer; each step is the same elementwise op as the plain expression, so bits match.
+    cost = np.multiply(risk, cost_spec.lambda_out * cost_spec.risk_scale)
+    np.add(cost, energy, out=cost)
+    np.multiply(cost, cost_spec.cost_scale, out=cost)
     return EdgeData(
         distance_m=distance_m,
         travel_time_s=travel_time_s,
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import hashlib
-import itertools
 import math
 import platform
 import subprocess
@@ -9,7 +8,7 @@ import sys
 import time
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, Iterable, List, Sequence, Set, Tuple
+from typing import Dict, List, Sequence, Set, Tuple
 
 import pandas as pd
 
@@ -27,6 +26,7 @@ from ..io.schema import (
 from ..risk import compute_risk_matrix
 from ..scenario import (
     generate_scenario,
+    iter_scenario_specs as _iter_specs,
     load_frozen_instance,
     save_frozen_instance,
     scenario_instance_id,
@@ -100,59 +100,6 @@ def _time_limits_for_size(cfg, n_clients: int, profile_name: str) -> Dict[str, f
     return {"heuristic": scalability, "highs": 0.0}
 
 
-def _iter_specs(
-    cfg,
-    profile_name: str,
-    max_cases: int = 0,
-    shard_index: int = 0,
-    num_shards: int = 1,
-) -> Iterable[ScenarioSpec]:
-    if num_shards < 1:
-        raise ValueError("num_shards must be >= 1")
-    if shard_index < 0 or shard_index >= num_shards:
-        raise ValueError("shard_index must be in [0, num_shards)")
-
-    profile = cfg.profiles[profile_name]
-    sizes = list(profile.sizes)
-    if profile.include_scalability:
-        sizes.append(cfg.scalability_size)
-
-    count = 0
-    for spec_idx, (seed, n, b, d, k, lo, ltw) in enumerate(
-        itertools.product(
-            profile.seeds,
-            sizes,
-            profile.bs_counts,
-            profile.deltas_min,
-            profile.edge_samples,
-            profile.lambda_out,
-            profile.lambda_tw,
-        )
-    ):
-        if spec_idx % num_shards != shard_index:
-            continue
-        if max_cases and count >= max_cases:
-            break
-        run_key = (
-            f"seed{seed}_N{n}_M{cfg.num_uavs}_D{d}_B{b}_K{k}_"
-            f"lo{lo}_lt{ltw}_tw{cfg.tw.family}"
-        )
-        yield ScenarioSpec(
-            run_id=run_key,
-            seed=int(seed),
-            n_clients=int(n),
-            num_uavs=cfg.num_uavs,
-            delta_min=int(d),
-            bs_count=int(b),
-            edge_samples=int(k),
-            lambda_out=float(lo),
-            lambda_tw=float(ltw),
-            tw_family=cfg.tw.family,
-            tw_mode=cfg.tw.mode,
-        )
-        count += 1
-
-
 def _safe_solver_call(name: str, func, *args, **kwargs) -> SolverOutput:
     start = time.perf_counter()
     try:
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import json
+import math
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+def _finite_or_none(node: Any) -> Any:
+    # orjson writes NaN/Infinity as null; do the same so both encoders agree.
+    if isinstance(node, float):
+        return node if math.isfinite(node) else None
+    if isinstance(node, dict):
+        return {key: _finite_or_none(value) for key, value in node.items()}
+    if isinstance(node, (list, tuple)):
+        return [_finite_or_none(value) for value in node]
+    return node
+
+
+def json_bytes(payload: object, *, pretty: bool = True) -> bytes:
+    # Both paths write UTF-8 text, null for non-finite floats and the same separators, so
+    # the bytes match whichever encoder is installed (floats printed in exponent form,
+    # beyond 1e16 or below 1e-4, are the one spelling difference). The numpy and
+    # non-str-key options let orjson take anything json.dumps accepts.
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(payload, option=option)
+    if pretty:
+        text = json.dumps(_finite_or_none(payload), indent=2, ensure_ascii=False)
+    else:
+        text = json.dumps(_finite_or_none(payload), separators=(",", ":"), ensure_ascii=False)
+    return text.encode("utf-8")
+
+
+def json_loads(raw: bytes) -> Any:
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # Older reports written by json.dumps may carry NaN/Infinity, which orjson rejects.
+            pass
+    return json.loads(raw)
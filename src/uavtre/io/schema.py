@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import Any, Dict, List, Optional
 
 import numpy as np
@@ -217,6 +218,16 @@ class ScenarioData:
     capacity_kg: float
     altitude_m: float
 
+    @cached_property
+    def coords(self) -> np.ndarray:
+        # Depot at row 0, clients after; built once and shared by the edge-matrix builders,
+        # so it is handed out read-only.
+        buf = np.empty((1 + len(self.client_xy), 2), dtype=float)
+        buf[0] = self.depot_xy
+        buf[1:] = self.client_xy
+        buf.flags.writeable = False
+        return buf
+
 
 @dataclass
 class EdgeData:
@@ -1,9 +1,10 @@
 from .edge_risk import compute_risk_matrix
-from .radio_model import edge_outage_risk, los_probability, pathloss_db
+from .radio_model import edge_outage_risk, edge_outage_risk_batch, los_probability, pathloss_db
 
 __all__ = [
     "compute_risk_matrix",
     "edge_outage_risk",
+    "edge_outage_risk_batch",
     "los_probability",
     "pathloss_db",
 ]
@@ -3,7 +3,7 @@ from __future__ import annotations
 import numpy as np
 
 from ..io.schema import ScenarioData
-from .radio_model import edge_outage_risk
+from .radio_model import edge_outage_risk_batch
 
 
 def compute_risk_matrix(
@@ -11,21 +11,21 @@ def compute_risk_matrix(
     comm_params: dict,
     edge_samples: int,
 ) -> np.ndarray:
-    coords = np.vstack([scenario.depot_xy, scenario.client_xy])
+    coords = scenario.coords
     n_nodes = coords.shape[0]
     risk = np.zeros((n_nodes, n_nodes), dtype=float)
 
-    for i in range(n_nodes):
-        for j in range(i + 1, n_nodes):
-            r = edge_outage_risk(
-                p1=coords[i],
-                p2=coords[j],
-                bs_xy=scenario.bs_xy,
-                altitude_m=scenario.altitude_m,
-                k_samples=edge_samples,
-                comm_params=comm_params,
-            )
-            risk[i, j] = r
-            risk[j, i] = r
+    # One batched evaluation over every unordered pair, then mirror into both triangles.
+    rows, cols = np.triu_indices(n_nodes, k=1)
+    pair_risk = edge_outage_risk_batch(
+        p1=coords[rows],
+        p2=coords[cols],
+        bs_xy=scenario.bs_xy,
+        altitude_m=scenario.altitude_m,
+        k_samples=edge_samples,
+        comm_params=comm_params,
+    )
+    risk[rows, cols] = pair_risk
+    risk[cols, rows] = pair_risk
 
     return risk
@@ -4,11 +4,13 @@ from .generator import (
     save_frozen_instance,
     scenario_instance_id,
 )
+from .grid import iter_scenario_specs
 from .time_windows import build_time_windows
 
 __all__ = [
     "build_time_windows",
     "generate_scenario",
+    "iter_scenario_specs",
     "load_frozen_instance",
     "save_frozen_instance",
     "scenario_instance_id",
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import itertools
+from typing import Iterator
+
+from ..io.schema import ProjectConfig, ScenarioSpec
+
+
+def iter_scenario_specs(
+    cfg: ProjectConfig,
+    profile_name: str,
+    max_cases: int = 0,
+    shard_index: int = 0,
+    num_shards: int = 1,
+) -> Iterator[ScenarioSpec]:
+    if num_shards < 1:
+        raise ValueError("num_shards must be >= 1")
+    if shard_index < 0 or shard_index >= num_shards:
+        raise ValueError("shard_index must be in [0, num_shards)")
+
+    profile = cfg.profiles[profile_name]
+    sizes = list(profile.sizes)
+    if profile.include_scalability:
+        sizes.append(cfg.scalability_size)
+
+    grid = itertools.product(
+        profile.seeds,
+        sizes,
+        profile.bs_counts,
+        profile.deltas_min,
+        profile.edge_samples,
+        profile.lambda_out,
+        profile.lambda_tw,
+    )
+    # Take this shard's slice (every num_shards-th point, capped at max_cases) in C,
+    # so specs are only built for the cases the caller will actually run.
+    stop = shard_index + max_cases * num_shards if max_cases else None
+    num_uavs = cfg.num_uavs
+    tw_family = cfg.tw.family
+    tw_mode = cfg.tw.mode
+    for seed, n, b, d, k, lo, ltw in itertools.islice(grid, shard_index, stop, num_shards):
+        # Keys format the raw config values, so they match previously written runs exactly.
+        run_key = f"seed{seed}_N{n}_M{num_uavs}_D{d}_B{b}_K{k}_lo{lo}_lt{ltw}_tw{tw_family}"
+        yield ScenarioSpec(
+            run_id=run_key,
+            seed=int(seed),
+            n_clients=int(n),
+            num_uavs=num_uavs,
+            delta_min=int(d),
+            bs_count=int(b),
+            edge_samples=int(k),
+            lambda_out=float(lo),
+            lambda_tw=float(ltw),
+            tw_family=tw_family,
+            tw_mode=tw_mode,
+        )
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+from uavtre.io.schema import (
+    RESULTS_MAIN_COLUMNS,
+    RESULTS_ROUTES_COLUMNS,
+    RESULTS_SIGNIFICANCE_COLUMNS,
+)
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / "scripts"))
+
+import audit_journal_readiness  # noqa: E402
+
+
+def _write_header(path: Path, columns: list[str]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(",".join(columns) + "\n", encoding="utf-8")
+
+
+def test_also_parquet_mirrors_json_gates(monkeypatch, tmp_path) -> None:
+    pd = pytest.importorskip("pandas")
+    pytest.importorskip("pyarrow")
+
+    outputs = tmp_path / "outputs"
+    runs = {name: outputs / name / "results_main.csv" for name in ("main_a", "scal_a", "main_b", "scal_b")}
+    for path in runs.values():
+        _write_header(path, RESULTS_MAIN_COLUMNS)
+    _write_header(outputs / "results_main.csv", RESULTS_MAIN_COLUMNS)
+    _write_header(outputs / "results_routes.csv", RESULTS_ROUTES_COLUMNS)
+    _write_header(outputs / "results_significance.csv", RESULTS_SIGNIFICANCE_COLUMNS)
+    json_out = outputs / "audit" / "journal_readiness_test.json"
+
+    monkeypatch.chdir(tmp_path)
+    argv = ["audit_journal_readiness.py", "--output-root", str(outputs), "--json-out", str(json_out)]
+    for name, path in runs.items():
+        argv += [f"--{name.replace('_', '-')}", str(path)]
+    monkeypatch.setattr(sys, "argv", [*argv, "--also-parquet"])
+    audit_journal_readiness.main()
+
+    report = json.loads(json_out.read_text(encoding="utf-8"))
+    table = pd.read_parquet(json_out.with_suffix(".parquet"))
+
+    assert list(table.columns) == ["gate_id", "severity", "passed", "message", "generated_at_utc"]
+    assert len(report["gates"]) == report["summary"]["total_gates"] == len(table) > 0
+    expected = [{**gate, "generated_at_utc": report["generated_at_utc"]} for gate in report["gates"]]
+    assert table.to_dict(orient="records") == expected
+    # Both outcomes must be present, or the passed column is not really checked.
+    assert set(table["passed"]) == {True, False}
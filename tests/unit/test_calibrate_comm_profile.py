@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import random
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / "scripts"))
+
+import calibrate_comm_profile  # noqa: E402
+
+BASE_THR = 10.0
+GRID = [float(t) for t in np.linspace(BASE_THR, BASE_THR + 40.0, 17)]
+
+
+def _sweep(risks: list[float], target_low: float, target_high: float) -> float:
+    # The original full sweep: score every grid point, stable sort, keep the first.
+    candidates = []
+    for thr, mr in zip(GRID, risks):
+        score = 0.0
+        if mr < target_low:
+            score = target_low - mr
+        elif mr > target_high:
+            score = mr - target_high
+        candidates.append((score, mr, thr))
+    candidates.sort(key=lambda x: x[0])
+    return candidates[0][2]
+
+
+def _calibrate(monkeypatch, risks: list[float], target_low: float, target_high: float) -> float:
+    monkeypatch.setattr(calibrate_comm_profile, "build_scenarios", lambda *args: [])
+    monkeypatch.setattr(
+        calibrate_comm_profile,
+        "mean_edge_risk",
+        lambda cfg, scenarios: risks[GRID.index(cfg.comm["snr_threshold_db"])],
+    )
+    cfg = SimpleNamespace(comm={"snr_threshold_db": BASE_THR})
+    result = calibrate_comm_profile.calibrate(cfg, target_low, target_high, 4, 20, 10, [1])
+    return result["snr_threshold_db"]
+
+
+@pytest.mark.parametrize(
+    "risks",
+    [
+        [0.0] * 8 + [0.9] * 9,  # flat below the band, then jumps past it
+        list(np.linspace(0.0, 0.8, 17)),  # crosses the band
+        [0.5] * 17,  # entirely above the band
+        [0.05] * 17,  # entirely below the band
+        [0.0, 0.0, 0.05, 0.05, 0.05] + [0.2] * 12,  # tied stretch inside the band
+        [0.0] * 3 + [0.05] * 5 + [0.35] * 9,  # equal scores either side of target_low
+        [0.0] * 4 + [1e-17] * 4 + [0.6] * 9,  # distinct risks that round to one score
+    ],
+)
+def test_bisection_matches_full_sweep(monkeypatch, risks) -> None:
+    assert _calibrate(monkeypatch, risks, 0.1, 0.3) == _sweep(risks, 0.1, 0.3)
+
+
+def test_bisection_matches_full_sweep_on_random_monotone_risk(monkeypatch) -> None:
+    rng = random.Random(0)
+    for _ in range(300):
+        levels = sorted(rng.choice([0.0, 0.02, 0.05, 0.1, 0.2, 0.3, 0.4, 0.9]) for _ in range(17))
+        low = rng.choice([0.05, 0.1, 0.2])
+        high = low + rng.choice([0.0, 0.1, 0.2])
+        assert _calibrate(monkeypatch, levels, low, high) == _sweep(levels, low, high)
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / "scripts"))
+
+import check_manuscript_pack_consistency as checker  # noqa: E402
+
+CID = "camp_x"
+
+
+def _run(monkeypatch, capsys, submission: Path) -> list[str]:
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        [
+            "check_manuscript_pack_consistency.py",
+            "--campaign-id",
+            CID,
+            "--submission-dir",
+            str(submission),
+            "--anonymous-dir",
+            str(submission.parent / "anonymous"),
+            "--camera-ready-dir",
+            str(submission.parent / "camera_ready"),
+        ],
+    )
+    with pytest.raises(SystemExit):
+        checker.main()
+    return json.loads(capsys.readouterr().out)["errors"]
+
+
+@pytest.mark.skipif(not hasattr(os, "symlink"), reason="symlinks unsupported")
+def test_dangling_symlink_counts_as_missing(monkeypatch, capsys, tmp_path) -> None:
+    submission = tmp_path / "submission"
+    submission.mkdir()
+    (submission / "build_instructions.md").write_text("ok\n", encoding="utf-8")
+    (submission / "proposal_highlights.txt").symlink_to(submission / "build_instructions.md")
+    (submission / "cover_letter_draft.txt").symlink_to(submission / "gone.txt")
+
+    missing = {e.removeprefix("missing file: ") for e in _run(monkeypatch, capsys, submission)}
+
+    assert (submission / "cover_letter_draft.txt").as_posix() in missing
+    assert (submission / "tr_e_presubmission_checklist.md").as_posix() in missing
+    assert (submission / "build_instructions.md").as_posix() not in missing
+    assert (submission / "proposal_highlights.txt").as_posix() not in missing
+
+
+def test_listings_are_taken_per_run(monkeypatch, capsys, tmp_path) -> None:
+    submission = tmp_path / "submission"
+    submission.mkdir()
+    checklist = (submission / "tr_e_presubmission_checklist.md").as_posix()
+
+    assert f"missing file: {checklist}" in _run(monkeypatch, capsys, submission)
+    (submission / "tr_e_presubmission_checklist.md").write_text("ok\n", encoding="utf-8")
+    assert f"missing file: {checklist}" not in _run(monkeypatch, capsys, submission)
+
+
+def test_root_and_parent_paths_exist(tmp_path) -> None:
+    assert checker._exists(Path(tmp_path.anchor), {})
+    assert checker._exists(tmp_path / "..", {})
+    assert not checker._exists(tmp_path / "absent", {})
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from uavtre.io.loaders import load_project_config
+from uavtre.io.schema import ScenarioData
+from uavtre.risk.edge_risk import compute_risk_matrix
+from uavtre.risk.radio_model import edge_outage_risk, edge_outage_risk_batch
+
+
+ROOT = Path(__file__).resolve().parents[2]
+BASE_COMM = load_project_config(ROOT / "configs" / "base.json").comm
+
+
+def _comm(**changes: float) -> dict:
+    comm = dict(BASE_COMM)
+    comm.update(changes)
+    return comm
+
+
+COMM_PROFILES = {
+    # Path loss never falls with range here, so the batch keeps only the nearest station.
+    "base": BASE_COMM,
+    # Either change breaks that ordering and forces the full per-station evaluation.
+    "los_bonus_inverted": _comm(eta_los=25.0, eta_nlos=5.0),
+    "negative_los_a": _comm(los_a=-0.5, snr_threshold_db=35.0),
+}
+
+
+@pytest.mark.parametrize("profile", sorted(COMM_PROFILES))
+@pytest.mark.parametrize("k_samples", [1, 2, 10])
+@pytest.mark.parametrize("bs_count", [1, 4, 12])
+def test_batch_matches_per_edge_risk(profile: str, k_samples: int, bs_count: int) -> None:
+    comm = COMM_PROFILES[profile]
+    rng = np.random.default_rng(k_samples * 100 + bs_count)
+    p1 = rng.uniform(0.0, 4000.0, size=(200, 2))
+    p2 = rng.uniform(0.0, 4000.0, size=(200, 2))
+    bs_xy = rng.uniform(0.0, 4000.0, size=(bs_count, 2))
+
+    batch = edge_outage_risk_batch(p1, p2, bs_xy, 100.0, k_samples, comm)
+    expected = np.array(
+        [edge_outage_risk(a, b, bs_xy, 100.0, k_samples, comm) for a, b in zip(p1, p2)]
+    )
+
+    np.testing.assert_array_equal(batch, expected)
+    # Guard against a vacuous pass: the sample must straddle the SNR threshold.
+    assert 0.0 < expected.mean() < 1.0
+
+
+def _scenario(n_clients: int, bs_count: int, seed: int) -> ScenarioData:
+    rng = np.random.default_rng(seed)
+    zeros = np.zeros(n_clients)
+    return ScenarioData(
+        depot_xy=np.array([2000.0, 2000.0]),
+        client_xy=rng.uniform(0.0, 4000.0, size=(n_clients, 2)),
+        delivery=zeros,
+        pickup=zeros,
+        service_duration_s=zeros,
+        tw_early_s=zeros,
+        tw_late_s=zeros + 3600.0,
+        bs_xy=rng.uniform(0.0, 4000.0, size=(bs_count, 2)),
+        speed_mps=15.0,
+        capacity_kg=5.0,
+        altitude_m=100.0,
+    )
+
+
+@pytest.mark.parametrize("edge_samples", [1, 10])
+@pytest.mark.parametrize("bs_count", [1, 4])
+def test_risk_matrix_matches_per_pair_loop(edge_samples: int, bs_count: int) -> None:
+    scenario = _scenario(n_clients=12, bs_count=bs_count, seed=edge_samples + bs_count)
+    coords = np.vstack([scenario.depot_xy, scenario.client_xy])
+    n_nodes = coords.shape[0]
+
+    expected = np.zeros((n_nodes, n_nodes))
+    for i in range(n_nodes):
+        for j in range(i + 1, n_nodes):
+            r = edge_outage_risk(
+                coords[i], coords[j], scenario.bs_xy, scenario.altitude_m, edge_samples, BASE_COMM
+            )
+            expected[i, j] = r
+            expected[j, i] = r
+
+    risk = compute_risk_matrix(scenario, BASE_COMM, edge_samples)
+
+    np.testing.assert_array_equal(risk, expected)
+    np.testing.assert_array_equal(risk, risk.T)
+    assert not np.diag(risk).any()
+    assert 0.0 < risk.mean() < 1.0
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / "scripts"))
+
+import generate_github_release_assets  # noqa: E402
+
+CID = "camp_x"
+ARTIFACTS = [
+    f"RELEASE_NOTE_{CID}.md",
+    f"MANUSCRIPT_PACK_MANIFEST_{CID}.json",
+    f"claim_evidence_map_{CID}.md",
+    f"TABLE_FIGURE_INDEX_{CID}.md",
+    f"results_discussion_draft_{CID}.md",
+    f"next_steps_{CID}.md",
+    "build_instructions.md",
+    "tr_e_presubmission_checklist.md",
+    "proposal_highlights.txt",
+]
+
+
+def _run(monkeypatch, tmp_path: Path, *extra: str) -> Path:
+    submission = tmp_path / "output" / "submission"
+    submission.mkdir(parents=True, exist_ok=True)
+    for i, name in enumerate(ARTIFACTS):
+        if name.endswith(".json"):
+            (submission / name).write_text(json.dumps({"audit_summary": {"overall_pass": True}}))
+        else:
+            (submission / name).write_text(f"artifact {i}: {name}\n" * (i + 1))
+
+    monkeypatch.setattr(generate_github_release_assets, "ROOT", tmp_path)
+    monkeypatch.setattr(sys, "argv", ["generate_github_release_assets.py", "--campaign-id", CID, *extra])
+    generate_github_release_assets.main()
+    return submission
+
+
+def _checksum_lines(path: Path) -> list[tuple[str, str]]:
+    # b2sum/sha256sum format: "<hex>  <path>".
+    lines = path.read_text(encoding="utf-8").splitlines()
+    pairs = [tuple(line.split("  ", 1)) for line in lines]
+    assert [rel for _, rel in pairs] == [f"output/submission/{name}" for name in ARTIFACTS]
+    return pairs
+
+
+def test_default_digest_keeps_sha256_file(monkeypatch, tmp_path) -> None:
+    submission = _run(monkeypatch, tmp_path)
+
+    out = submission / f"ARTIFACT_SHA256_{CID}.txt"
+    for hexdigest, rel in _checksum_lines(out):
+        assert hexdigest == hashlib.sha256((tmp_path / rel).read_bytes()).hexdigest()
+    assert f"ARTIFACT_SHA256_{CID}.txt" in (submission / "GITHUB_RELEASE_BODY_v1.0.0-journal-repro.md").read_text()
+
+
+def test_blake2b_digest_writes_b2sum_file(monkeypatch, tmp_path) -> None:
+    submission = _run(monkeypatch, tmp_path, "--digest", "blake2b")
+
+    out = submission / f"ARTIFACT_BLAKE2B_{CID}.txt"
+    for hexdigest, rel in _checksum_lines(out):
+        assert re.fullmatch(r"[0-9a-f]{128}", hexdigest)
+        assert hexdigest == hashlib.blake2b((tmp_path / rel).read_bytes()).hexdigest()
+    assert not (submission / f"ARTIFACT_SHA256_{CID}.txt").exists()
+
+
+def test_xxh3_digest(monkeypatch, tmp_path) -> None:
+    xxhash = pytest.importorskip("xxhash")
+    submission = _run(monkeypatch, tmp_path, "--digest", "xxh3")
+
+    out = submission / f"ARTIFACT_XXH3_{CID}.txt"
+    for hexdigest, rel in _checksum_lines(out):
+        assert hexdigest == xxhash.xxh3_64((tmp_path / rel).read_bytes()).hexdigest()
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import math
+
+import numpy as np
+import pytest
+
+from uavtre.cli import _common
+from uavtre.io import json_codec
+
+# Shaped like the run-plan, environment and bundle manifests the CLIs write.
+METADATA = {
+    "created_at_utc": "2026-01-02T03:04:05+00:00",
+    "python": "3.12.1 (main) [GCC 13.2.0]",
+    "platform": "Linux-6.1-x86_64",
+    "author": "Zoë Müller – anonymous ≤ review",
+    "runs": [
+        {"profile": "main_table", "shard": 0, "n_shards": 4, "elapsed_s": 12.5, "ok": True},
+        {"profile": "scalability", "shard": 1, "n_shards": 4, "elapsed_s": float("nan"), "ok": False},
+    ],
+    "gap": {"mean": np.float64(0.25), "worst": float("inf"), "best": -float("inf")},
+    "by_size": {10: 1.0, 20: 0.5},
+    "pair": ("ortools_main", 20),
+    "empty": {"list": [], "dict": {}},
+    "note": None,
+}
+
+
+def _stdlib(monkeypatch, pretty: bool) -> bytes:
+    monkeypatch.setattr(json_codec, "orjson", None)
+    return json_codec.json_bytes(METADATA, pretty=pretty)
+
+
+@pytest.mark.parametrize("pretty", [False, True])
+def test_stdlib_fallback_writes_strict_utf8_json(monkeypatch, pretty: bool) -> None:
+    text = _stdlib(monkeypatch, pretty).decode("utf-8")
+
+    assert "Zoë Müller – anonymous ≤ review" in text
+    assert "NaN" not in text and "Infinity" not in text
+    assert ('"by_size": {' in text) is pretty
+
+
+@pytest.mark.parametrize("pretty", [False, True])
+def test_orjson_and_stdlib_write_the_same_bytes(monkeypatch, pretty: bool) -> None:
+    if json_codec.orjson is None:
+        pytest.skip("orjson is not installed")
+    fast = json_codec.json_bytes(METADATA, pretty=pretty)
+    assert _stdlib(monkeypatch, pretty) == fast
+
+
+def test_exponent_floats_parse_the_same(monkeypatch) -> None:
+    # The only spelling difference: orjson writes 1e16 where json.dumps writes 1e+16.
+    if json_codec.orjson is None:
+        pytest.skip("orjson is not installed")
+    payload = {"metrics": [1e16, -2.5e-7, 0.1]}
+    fast = json_codec.json_bytes(payload)
+    monkeypatch.setattr(json_codec, "orjson", None)
+    assert json_codec.json_loads(fast) == json_codec.json_loads(json_codec.json_bytes(payload)) == payload
+
+
+def test_json_loads_accepts_stdlib_nan_output() -> None:
+    # Reports written before the encoders agreed may still carry bare NaN tokens.
+    parsed = json_codec.json_loads(b'{"gap": NaN, "ok": 1}')
+    assert math.isnan(parsed["gap"]) and parsed["ok"] == 1
+
+
+def test_dumps_json_uses_the_shared_encoder(monkeypatch) -> None:
+    for pretty in (False, True):
+        assert _common.dumps_json(METADATA, pretty=pretty) == json_codec.json_bytes(
+            METADATA, pretty=pretty
+        ).decode("utf-8")
+    monkeypatch.setattr(json_codec, "orjson", None)
+    assert _common.dumps_json({"a": float("nan"), "b": "é"}) == '{"a":null,"b":"é"}'
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import csv
+import math
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+from pandas._libs.parsers import STR_NA_VALUES
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / "scripts"))
+
+import writing_pack_common  # noqa: E402
+
+# One column per inference case read_csv distinguishes, five rows each.
+MIXED_COLUMNS = {
+    "ints": ["1", " 2 ", "007", "+4", "-5"],
+    "ints_with_na": ["1", "", "3", "NA", "5"],
+    "floats": ["1.5", "1e3", ".5", "inf", "-Infinity"],
+    "float_words": ["nan", "NaN", "-nan", "1.", "2E-3"],
+    "underscored": ["1_000", " 2 ", "3", "4", "5"],
+    "fullwidth_digit": ["１", "2", "3", "4", "5"],
+    "hex": ["0x10", "1", "2", "3", "4"],
+    "bools": ["True", "false", "TRUE", "False", "true"],
+    "bools_with_na": ["True", "", "False", "n/a", "True"],
+    "padded_bool": [" True", "False", "True", "False", "True"],
+    "text": ["ortools_main", "", "NULL", "pyvrp_baseline", "x"],
+    "blank_text": ["  ", "1", "2", "3", "4"],
+    "all_na": ["", "NA", "", "null", ""],
+}
+
+
+def _same(ours: list, theirs: list) -> bool:
+    return len(ours) == len(theirs) and all(
+        type(a) is type(b) and (a == b or (isinstance(a, float) and math.isnan(a) and math.isnan(b)))
+        for a, b in zip(ours, theirs)
+    )
+
+
+def test_na_markers_match_read_csv_defaults() -> None:
+    assert writing_pack_common.NA_VALUES == STR_NA_VALUES
+
+
+def test_load_csv_matches_read_csv_on_mixed_columns(tmp_path) -> None:
+    path = tmp_path / "mixed.csv"
+    with path.open("w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(MIXED_COLUMNS)
+        writer.writerows(zip(*MIXED_COLUMNS.values()))
+
+    rows = writing_pack_common.load_csv(path)
+    frame = pd.read_csv(path)
+
+    mismatched = {
+        col: ([row[col] for row in rows], frame[col].tolist())
+        for col in MIXED_COLUMNS
+        if not _same([row[col] for row in rows], frame[col].tolist())
+    }
+    assert mismatched == {}
+
+
+@pytest.mark.parametrize("usecols", [frozenset({"ints", "text"}), frozenset()])
+def test_load_csv_usecols(tmp_path, usecols: frozenset[str]) -> None:
+    path = tmp_path / "mixed.csv"
+    path.write_text("ints,text,floats\n1,a,1.5\n2,b,2.5\n", encoding="utf-8")
+
+    rows = writing_pack_common.load_csv(path, usecols)
+
+    assert len(rows) == 2 and all(set(row) == usecols for row in rows)